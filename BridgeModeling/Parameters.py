@@ -26,3 +26,32 @@ dyn2_iter = 200     # Secondary maximum iterations
 dyn3_tol = 1.0e-4   # Tertiary convergence tolerance for dynamic analysis
 dyn3_iter = 4000    # Tertiary maximum iterations
 BroyCount = 8       # Broyden count for iterative solver
+
+# ----------------------------
+# Linear solver of the gravity and pushover analyses (op.system / op.numberer,
+# see benchmark_solvers.py). SparseGeneral crashes in OpenSeesPy 3.7 when the
+# integrator is redefined between steps, as the adaptive pushover does.
+# ----------------------------
+solver_system = 'UmfPack'       # e.g. 'BandGeneral', 'SparseGeneral', 'SparseSYM', 'Mumps'
+solver_numberer = 'RCM'         # e.g. 'Plain', 'AMD'
+
+# ----------------------------
+# Pushover analysis parameters (adaptive displacement control, see
+# pushover_analysis.run_adaptive_pushover); increments are fractions of LCol
+# ----------------------------
+push_dincr_init = 0.001     # First displacement increment
+push_dincr_min = 0.0001     # Smallest increment (the fixed Dincr of Pushover.ipynb)
+push_dincr_max = 0.002      # Largest increment
+push_iter_target = 6        # Newton iterations per step the increment is tuned for
+push_trial_iter = 2         # Iteration cap of the steps above push_dincr_min (a trial that needs
+                            # more is cut before the fiber elements fail, which costs seconds)
+push_grow = 2.0             # Increment growth after a step within push_iter_target / 2 iterations
+push_shrink = 0.5           # Increment cut after a slow or softening step
+push_cut = 0.25             # Increment cut after a failed step
+push_hold = 500             # Steps after a failure before the increment may grow back to the failed size
+push_softening = 0.8        # Tangent stiffness ratio (step / previous step) that counts as softening
+push_steady = 0.95          # Tangent stiffness ratio below which the increment no longer grows
+push_yield_ratio = 0.5      # Tangent / initial stiffness below which the pier has yielded
+push_post_yield = None      # Stop at push_post_yield x the yield drift (None: run to Dmax; an early
+                            # stop shortens the post-yield branch and biases k2 of the fit) ...
+push_post_yield_points = 20 # ... with at least this many post-yield steps
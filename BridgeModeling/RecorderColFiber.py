@@ -5,28 +5,183 @@
 
 
 import os
+import numpy as np
 import openseespy.opensees as op
 
-def define_recorders(folder='RecorderData'):
+# Column layout of each recorder file (with '-time')
+cols_forces = [
+    "time", "P_i", "V2_i", "V3_i", "T_i", "M2_i", "M3_i",
+    "P_j", "V2_j", "V3_j", "T_j", "M2_j", "M3_j"
+]
+cols_col_disp = ["time"] + [f"{dof}_{end}" for end in ("i", "j")
+                            for dof in ("ux", "uy", "uz", "rx", "ry", "rz")]
+cols_node_disp = ["time", "ux", "uy", "uz", "rx", "ry", "rz"]
+
+
+def recorder_file(folder, name, binary=False):
+    """
+    Path of a recorder file: '<name>.out' for text output, '<name>.bin' for binary output.
+    """
+    return os.path.join(folder, f"{name}.bin" if binary else f"{name}.out")
+
+
+def define_recorders(folder='RecorderData', binary=False):
     os.makedirs(folder, exist_ok=True)
+    mode = '-binary' if binary else '-file'
 
     # Column 3101
-    op.recorder('Element', '-file', os.path.join(folder, 'ColLocForce.3101.out'), '-time', '-ele', 3101, 'localForce')
+    op.recorder('Element', mode, recorder_file(folder, 'ColLocForce.3101', binary), '-time', '-ele', 3101, 'localForce')
     for col_id in [3201, 3301]:
-        op.recorder('Element', '-file', os.path.join(folder, f'ColLocForce.{col_id}.out'), '-time', '-ele', col_id, 'localForce')
+        op.recorder('Element', mode, recorder_file(folder, f'ColLocForce.{col_id}', binary), '-time', '-ele', col_id, 'localForce')
 
 
-def define_displacement_recorders(folder='RecorderData'):
+def define_displacement_recorders(folder='RecorderData', binary=False):
     os.makedirs(folder, exist_ok=True)
+    mode = '-binary' if binary else '-file'
     # Column node displacements
-    op.recorder('Node', '-file', os.path.join(folder, 'ColDisplacement.3101.out'), '-time',
+    op.recorder('Node', mode, recorder_file(folder, 'ColDisplacement.3101', binary), '-time',
                 '-node', 3101, 3102, '-dof', 1, 2, 3, 4, 5, 6, 'disp')
-    op.recorder('Node', '-file', os.path.join(folder, 'ColDisplacement.3201.out'), '-time',
+    op.recorder('Node', mode, recorder_file(folder, 'ColDisplacement.3201', binary), '-time',
                 '-node', 3201, 3202, '-dof', 1, 2, 3, 4, 5, 6, 'disp')
-    op.recorder('Node', '-file', os.path.join(folder, 'ColDisplacement.3301.out'), '-time',
+    op.recorder('Node', mode, recorder_file(folder, 'ColDisplacement.3301', binary), '-time',
                 '-node', 3301, 3302, '-dof', 1, 2, 3, 4, 5, 6, 'disp')
 # [5101, 5201, 5301]
     # Individual node displacements (6 DOF)
     for node_id in [5201]:
-        op.recorder('Node', '-file', os.path.join(folder, f'Displacement.{node_id}.out'), '-time',
+        op.recorder('Node', mode, recorder_file(folder, f'Displacement.{node_id}', binary), '-time',
                     '-node', node_id, '-dof', 1, 2, 3, 4, 5, 6, 'disp')
+
+
+def read_binary_recorder(path, n_cols):
+    """
+    Memory-maps a recorder file written with '-binary'.
+
+    OpenSees writes every step as n_cols native doubles followed by a newline byte,
+    so the file is mapped as fixed-size records and the doubles are returned as a
+    strided (n_steps, n_cols) view. A trailing partial record (e.g. from a killed
+    run) is ignored.
+    """
+    record = np.dtype([('values', np.float64, (n_cols,)), ('eol', 'S1')])
+    n_rows = os.path.getsize(path) // record.itemsize
+    if n_rows == 0:
+        return np.empty((0, n_cols))
+    return np.memmap(path, dtype=record, mode='r', shape=(n_rows,))['values']
+
+
+def read_recorder(folder, name, columns, binary=False):
+    """
+    Reads one recorder file of a sample folder as an (n_steps, len(columns)) array.
+    """
+    path = recorder_file(folder, name, binary)
+    if binary:
+        return read_binary_recorder(path, len(columns))
+    return np.loadtxt(path, ndmin=2)
+
+
+def read_pushover_response(folder, binary=False, element_ids=(3101, 3201, 3301)):
+    """
+    Loads the pushover response of one sample folder, as used for the bilinear fit.
+
+    Returns:
+        dict: time, d (|uy| of node 5201, mm), V (|base shear|, kN),
+              M (|M3_j| of column 3201, kN·m) and theta (|rx| of node 3202, rad),
+              trimmed to a common length.
+    """
+    disp = read_recorder(folder, 'Displacement.5201', cols_node_disp, binary)
+    col_disp = read_recorder(folder, 'ColDisplacement.3201', cols_col_disp, binary)
+    forces = {ele: read_recorder(folder, f'ColLocForce.{ele}', cols_forces, binary)
+              for ele in element_ids}
+
+    n = min([len(disp), len(col_disp)] + [len(frc) for frc in forces.values()])
+    iV2, iM3 = cols_forces.index("V2_j"), cols_forces.index("M3_j")
+    base_shear = sum(frc[:n, iV2] for frc in forces.values())
+    return {
+        'time': np.array(disp[:n, 0]),
+        'd': np.abs(disp[:n, cols_node_disp.index("uy")]),
+        'V': np.abs(base_shear) / 1000.0,
+        'M': np.abs(forces[3201][:n, iM3]) / 1e6,
+        'theta': np.abs(col_disp[:n, 10]),
+    }
+
+
+class ResponseCapture:
+    """
+    In-process replacement of the file recorders for the pushover loop.
+
+    Call record() after every converged op.analyze(1) step; the control-node
+    displacement, the local forces of the columns and the rotations of the
+    column top nodes are written into preallocated arrays (grown if a fallback
+    runs more steps than planned), so no recorder file is touched.
+    """
+
+    def __init__(self, n_steps, ctrl_node=5201, ctrl_dof=2,
+                 element_ids=(3101, 3201, 3301), rot_nodes=(3102, 3202, 3302)):
+        self.ctrl_node = ctrl_node
+        self.ctrl_dof = ctrl_dof
+        self.element_ids = list(element_ids)
+        self.rot_nodes = list(rot_nodes)
+        self.n = 0
+        self._allocate(max(int(n_steps), 1))
+
+    def _allocate(self, size):
+        old = getattr(self, 'time', None)
+        time = np.zeros(size)
+        disp = np.zeros(size)
+        forces = np.zeros((size, len(self.element_ids), len(cols_forces) - 1))
+        rotations = np.zeros((size, len(self.rot_nodes)))
+        if old is not None:
+            time[:self.n] = self.time[:self.n]
+            disp[:self.n] = self.disp[:self.n]
+            forces[:self.n] = self.forces[:self.n]
+            rotations[:self.n] = self.rotations[:self.n]
+        self.time, self.disp, self.forces, self.rotations = time, disp, forces, rotations
+
+    def record(self):
+        if self.n == len(self.time):
+            self._allocate(2 * len(self.time))
+        i = self.n
+        self.time[i] = op.getTime()
+        self.disp[i] = op.nodeDisp(self.ctrl_node, self.ctrl_dof)
+        for k, ele in enumerate(self.element_ids):
+            self.forces[i, k] = op.eleResponse(ele, 'localForce')
+        for k, node in enumerate(self.rot_nodes):
+            self.rotations[i, k] = op.nodeDisp(node, 4)
+        self.n += 1
+
+    def response(self):
+        """
+        Captured history in the format of read_pushover_response().
+        """
+        n = self.n
+        iV2, iM3 = cols_forces.index("V2_j") - 1, cols_forces.index("M3_j") - 1
+        k3201 = self.element_ids.index(3201)
+        return {
+            'time': self.time[:n].copy(),
+            'd': np.abs(self.disp[:n]),
+            'V': np.abs(self.forces[:n, :, iV2].sum(axis=1)) / 1000.0,
+            'M': np.abs(self.forces[:n, k3201, iM3]) / 1e6,
+            'theta': np.abs(self.rotations[:n, self.rot_nodes.index(3202)]),
+        }
+
+
+def resample_response(response, dincr):
+    """
+    Interpolates a pushover response onto the uniform drift grid k * dincr of the
+    fixed-step pushover, so that a run with adaptive increments (dense at the knee,
+    sparse elsewhere) weighs the bilinear fit like a fixed-step run.
+
+    Parameters:
+        response (dict): Response as returned by ResponseCapture.response() or
+                         read_pushover_response().
+        dincr (float): Drift increment of the grid (mm).
+
+    Returns:
+        dict: The same keys, every series sampled at the multiples of dincr
+              between the first and the last recorded drift.
+    """
+    d = response['d']
+    if len(d) == 0:
+        return {key: np.array(values) for key, values in response.items()}
+    grid = dincr * np.arange(max(np.ceil(d[0] / dincr - 1e-6), 1), np.floor(d[-1] / dincr + 1e-6) + 1)
+    return {key: grid if key == 'd' else np.interp(grid, d, values)
+            for key, values in response.items()}
@@ -4,7 +4,9 @@
 # In[ ]:
 
 
+import numpy as np
 import openseespy.opensees as ops
+from model_data import SpringDepthIndex
 
 # 1) Define depth array for the soil materials
 depths = [
@@ -1118,6 +1120,38 @@ zero_length_defs = [
 
 
 
+def spring_exposure(matList):
+    """
+    Largest scourDepth at which a spring with these mats still exists:
+    -max(soil depth of its mats), or inf if none of them is a soil mat.
+    """
+    soil = [get_soil_depth(m) for m in matList if get_soil_depth(m) is not None]
+    return -max(soil) if soil else np.inf
+
+
+spring_index = SpringDepthIndex(zero_length_defs,
+                                [spring_exposure(d[3]) for d in zero_length_defs],
+                                [d[0] for d in zero_length_defs])
+
+
+def active_zero_length_defs(scourDepth):
+    """
+    The entries of zero_length_defs that still exist at scourDepth.
+    """
+    return spring_index.active(scourDepth)
+
+
+def define_zero_length(zl_def):
+    """
+    Creates one zero-length element from a zero_length_defs entry.
+    """
+    elemTag, iNode, jNode, matList, dirList = zl_def
+    # Flatten -mat / -dir arguments for OpenSees
+    mat_args = ["-mat"] + matList
+    dir_args = ["-dir"] + dirList
+    ops.element('zeroLength', elemTag, iNode, jNode, *mat_args, *dir_args)
+
+
 # 3) Define the function that loops over zero_length_defs & applies scour logic
 def defineZeroLengthElement(scourDepth):
     """
@@ -1383,23 +1417,8 @@ def defineZeroLengthElement(scourDepth):
     ops.element('zeroLength', 15809, 839, 869, '-mat', 61, '-dir', 1)
     ops.element('zeroLength', 16809, 869, 839, '-mat', 62, '-dir', 1)
     
-    for (elemTag, iNode, jNode, matList, dirList) in zero_length_defs:
-
-        # Decide whether to skip based on any soil mat in matList
-        skip_this = False
-        for mtag in matList:
-            depth = get_soil_depth(mtag)
-            if depth is not None:  # i.e. this mat_tag is a soil mat
-                # If depth > -scourDepth => it lies above the scoured zone => skip
-                if depth > -scourDepth:
-                    skip_this = True
-                    break
-
-        if not skip_this:
-            # Flatten -mat / -dir arguments for OpenSees
-            mat_args = ["-mat"] + matList
-            dir_args = ["-dir"] + dirList
-            ops.element('zeroLength', elemTag, iNode, jNode, *mat_args, *dir_args)
+    for zl_def in active_zero_length_defs(scourDepth):
+        define_zero_length(zl_def)
 
     print(f"Finished creating zero-length elements (scourDepth = {scourDepth}).")
 
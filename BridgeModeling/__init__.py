@@ -0,0 +1,51 @@
+# BridgeModeling
+# Package entry point. The modules of this folder import each other by bare name
+# (as in the notebooks), so the folder is put on sys.path and the public names
+# below are resolved lazily: `import BridgeModeling` costs nothing, and
+# `BridgeModeling.build_model` only imports model_setup (and, on the first
+# build, loads the cached model tables of model_data).
+import importlib
+import os
+import sys
+
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
+
+# public name -> module that defines it
+_exports = {
+    'build_model': 'model_setup',
+    'ModelTemplate': 'model_setup',
+    'ModelTables': 'model_data',
+    'load_model_tables': 'model_data',
+    'write_model_tables': 'model_data',
+    'BridgeGenerator': 'bridge_generator',
+    'generate_bridge': 'bridge_generator',
+    'run_sample': 'pushover_analysis',
+    'run_scour_sweep': 'pushover_analysis',
+    'scour_depth_grid': 'pushover_analysis',
+    'read_scenario_samples': 'campaign',
+    'read_store_design': 'campaign',
+    'run_campaign': 'campaign',
+    'CampaignStore': 'campaign_store',
+    'CampaignManifest': 'campaign_manifest',
+    'ResponseCapture': 'RecorderColFiber',
+    'SolverTelemetry': 'solver_telemetry',
+    'benchmark_solvers': 'benchmark_solvers',
+    'read_pushover_response': 'RecorderColFiber',
+    'resample_response': 'RecorderColFiber',
+}
+
+__all__ = sorted(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_exports[name]), name)
+    globals()[name] = value  # later accesses skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
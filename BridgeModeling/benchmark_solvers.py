@@ -0,0 +1,114 @@
+# benchmark_solvers.py
+# Benchmark of the linear solvers (op.system / op.numberer) of the gravity and
+# pushover analyses. Every solver runs the same samples (a fixed set of scour
+# depths, gravity plus a fixed number of pushover steps); the table reports the
+# wall time per step and the largest deviation of the control-node displacement
+# and base shear from the reference solver (BandGeneral + RCM of Pushover.ipynb).
+#
+#   python benchmark_solvers.py
+import numpy as np
+import openseespy.opensees as op
+import pandas as pd
+
+from RecorderColFiber import ResponseCapture
+from solver_telemetry import SolverTelemetry
+from pushover_analysis import (LCol, IDctrlNode, IDctrlDOF, prepare_model, run_gravity,
+                               apply_lateral_load, setup_pushover_analysis, run_pushover)
+
+reference_solver = ('BandGeneral', 'RCM')
+candidate_solvers = [
+    ('BandGeneral', 'RCM'),
+    ('ProfileSPD', 'RCM'),
+    ('SparseGeneral', 'RCM'),
+    ('UmfPack', 'RCM'),
+    ('UmfPack', 'AMD'),
+    ('SparseSYM', 'RCM'),
+    ('Mumps', 'RCM'),
+]
+benchmark_scour_depths_mm = (0.0, 2000.0, 4000.0)
+
+
+def run_benchmark_sample(solver, scour_depth_mm, nsteps, fc=27.0, fy=420.0):
+    """
+    Build, gravity and nsteps fixed pushover steps of one sample with solver.
+
+    Returns:
+        tuple: (status, telemetry, response) with status 'done', 'gravity_failed',
+               'failed' or the error message of an unsupported solver.
+    """
+    telemetry = SolverTelemetry()
+    capture = ResponseCapture(nsteps, ctrl_node=IDctrlNode, ctrl_dof=IDctrlDOF)
+    try:
+        with telemetry.phase('build'):
+            prepare_model(fc, fy, round(scour_depth_mm + LCol, 1))
+        with telemetry.phase('gravity'):
+            if run_gravity(telemetry, solver) != 0:
+                return 'gravity_failed', telemetry, None
+        apply_lateral_load()
+        with telemetry.phase('pushover'):
+            setup_pushover_analysis(solver=solver)
+            ok, _ = run_pushover(nsteps, capture, verbose=False, telemetry=telemetry)
+    except Exception as e:
+        return f"error: {e}", telemetry, None
+    finally:
+        op.wipe()
+    return ('done' if ok == 0 else 'failed'), telemetry, capture.response()
+
+
+def max_rel_diff(a, b):
+    """
+    max |a - b| / max |b| over the common length of a and b.
+    """
+    n = min(len(a), len(b))
+    if n == 0:
+        return np.nan
+    return float(np.max(np.abs(a[:n] - b[:n])) / max(np.max(np.abs(b[:n])), 1e-300))
+
+
+def benchmark_solvers(solvers=candidate_solvers, scour_depths_mm=benchmark_scour_depths_mm,
+                      nsteps=20, fc=27.0, fy=420.0, verbose=True):
+    """
+    Times every solver on the same samples and compares it with reference_solver.
+
+    Parameters:
+        solvers (list): (system, numberer) pairs to benchmark.
+        scour_depths_mm (iterable): Scour depths of the samples (mm).
+        nsteps (int): Fixed pushover steps per sample (Dincr each).
+        fc, fy (float): Material strengths of the samples (MPa).
+        verbose (bool): Print one line per run.
+
+    Returns:
+        pd.DataFrame: One row per (solver, scour depth) with status, the build,
+                      gravity and pushover wall times (s), s_per_step (pushover
+                      time per converged step), test iterations, and d_rel_diff /
+                      V_rel_diff, the largest deviation of the control-node
+                      displacement and base shear from the reference solver.
+    """
+    reference = {depth: run_benchmark_sample(reference_solver, depth, nsteps, fc, fy)[2]
+                 for depth in scour_depths_mm}
+    rows = []
+    for system, numberer in solvers:
+        for depth in scour_depths_mm:
+            status, telemetry, response = run_benchmark_sample((system, numberer), depth,
+                                                               nsteps, fc, fy)
+            summary = telemetry.summary()
+            row = {'system': system, 'numberer': numberer, 'scour_depth_mm': depth,
+                   'status': status, 'build_s': summary['build_s'],
+                   'gravity_s': summary['gravity_s'], 'pushover_s': summary['pushover_s'],
+                   's_per_step': summary['pushover_s'] / max(summary['n_steps'], 1),
+                   'iterations': summary['iterations'], 'd_rel_diff': np.nan,
+                   'V_rel_diff': np.nan}
+            if response is not None and reference[depth] is not None:
+                row['d_rel_diff'] = max_rel_diff(response['d'], reference[depth]['d'])
+                row['V_rel_diff'] = max_rel_diff(response['V'], reference[depth]['V'])
+            if verbose:
+                print(f"{system:>13} + {numberer:<5} scour = {depth:7.1f} mm: {status}, "
+                      f"{row['s_per_step']:.3f} s/step, ΔV = {row['V_rel_diff']:.2e}")
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    results = benchmark_solvers()
+    print(results.groupby(['system', 'numberer'], sort=False)
+          [['gravity_s', 's_per_step', 'd_rel_diff', 'V_rel_diff']].max().to_string())
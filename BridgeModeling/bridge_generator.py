@@ -0,0 +1,459 @@
+# bridge_generator.py
+# Parametric generator of the bridge tables (nodes, restraints, constraints,
+# masses, elements, zero-length springs and gravity loads) that Node.py,
+# Restraint.py, Constraint.py, Mass.py, Element.py, ZeroLengthElement.py and
+# GravityLoad.py enumerate by hand. With the default parameters it reproduces
+# the hand-built model tag for tag (see reference_shear_key_flips); other spans,
+# span counts, deck widths and column heights give bridge variants in the same
+# layout, returned as the structured arrays of model_data.
+#
+# Layout and tag scheme (all lengths in mm, x along the bridge, z up):
+#   groups g = 1 .. 2*num_spans of deck nodes, one per span end; g = 1 and
+#   g = 2*num_spans are the abutments, bent b carries groups 2b and 2b+1.
+#     g01..g09   deck nodes on the girder lines (g05 on the centre line)
+#     g10..g17   bearing nodes under the girders (not at the abutments)
+#     g31..g39, g61..g69  abutment spring layers (middle, fixed)
+#   s91..s98     deck spine nodes of span s (elements s91..s99)
+#   bent b:  2b10..2b17 / 5b51 / 5b52 / 5b01 cap beam, 3b01-3b02 column,
+#            4b01 footing centre, 6b01..6b08 footing, 6b1p pile heads,
+#            7b0pdd pile nodes, 8b0pdd / 9b0pdd soil-spring nodes (p = 1..6)
+import os
+import runpy
+
+import numpy as np
+
+from model_data import (node_dtype, restraint_dtype, constraint_dtype, mass_dtype,
+                        element_dtype, spring_dtype, node_load_dtype, beam_load_dtype)
+
+# ── Reference bridge (BridgeModeling) ────────────────────────────
+num_girders = 8
+deck_overhang = 50.0        # deck edge to edge girder
+deck_segments = 9           # spine elements per span
+bearing_height = 1975.0     # deck to cap-beam axis
+cap_to_column = 875.0       # cap-beam axis to column top (rigid link 5b01)
+footing_offset = 750.0      # column bottom to footing, footing to pile heads
+column_edge = 2000.0        # cap-beam nodes 5b51 / 5b52 at -/+ column_edge
+pile_dx = np.array([1250.0, 1250.0, 1250.0, -1250.0, -1250.0, -1250.0])
+pile_dy = np.array([-2500.0, 0.0, 2500.0, 2500.0, 0.0, -2500.0])
+# pile node depths below the pile heads; springs at the head and the first 29
+pile_offsets = np.concatenate([np.arange(500.0, 10001.0, 500.0),
+                               np.arange(11000.0, 20001.0, 1000.0)])
+
+# elasticBeamColumn sections: A, E, G, J, Iy, Iz
+rigid_section = (10000000.0, 23665.0, 9860.417, 1e13, 1e14, 1e14)
+cap_section = (2100000.0, 23665.0, 9860.417, 574754000000.0, 535938000000.0, 252000000000.0)
+deck_section = (6987100.0, 23665.0, 9860.417, 197700000000.0, 2117000000000.0, 118919000000000.0)
+pile_section = (785398.16, 23665.0, 9860.417, 98200000000.0, 49100000000.0, 49100000000.0)
+column_section = (5, 1)     # nonlinearBeamColumn: integration points, section tag
+IDTransCol, IDTransCap, IDTransDeck = 1, 2, 3
+
+# Masses and gravity loads of the reference bridge (35 m spans, 12 m deck, 8.7 m columns)
+reference_span, reference_width, reference_column = 35000.0, 12000.0, 8700.0
+deck_node_mass = 67.930
+column_node_mass = 48.839
+cap_node_mass = 62.475
+pier_load = 976786.705      # N, downward at 5b01 (column weight, ~2 x column_node_mass x g)
+cap_beam_load = 52.5        # N/mm
+deck_load = 174.678         # N/mm
+
+# Abutment springs per deck node: (type, mat, dir, (i, j) at the first abutment,
+# (i, j) at the last one) with d = deck, m = middle and f = fixed layer. The
+# '14' shear keys alternate their orientation from one girder line to the next.
+abutment_springs = [
+    (11, 51, 1, 'md', 'md'),
+    (12, 51, 2, 'md', 'md'),
+    (17, 63, 2, 'fm', 'fm'),
+    (14, 54, 2, None, None),
+    (13, 52, 1, 'md', 'dm'),
+    (15, 61, 1, 'fm', 'mf'),
+    (16, 62, 1, 'mf', 'fm'),
+]
+# Order of the bearing nodes in constraints and bearing springs
+bearing_order = (10, 11, 12, 13, 17, 16, 15, 14)
+# Shear keys (type 8 bearing springs) whose cap -> deck orientation is reversed
+# in the hand-built ZeroLengthElement.py
+reference_shear_key_flips = (8214, 8215)
+
+
+def _table(dtype, n, **columns):
+    table = np.zeros(n, dtype=dtype)
+    for name, values in columns.items():
+        table[name] = values
+    return table
+
+
+def _elements(ele_type, tags, i_nodes, j_nodes, args, transf):
+    n = len(tags)
+    table = _table(element_dtype, n, type=ele_type, tag=tags, iNode=i_nodes,
+                   jNode=j_nodes, nargs=len(args), transf=transf)
+    table['args'][:, :len(args)] = args
+    return table
+
+
+def _springs(tags, i_nodes, j_nodes, mats, dirs, exposure=np.inf):
+    mats = np.atleast_2d(mats)
+    dirs = np.atleast_2d(dirs)
+    n = len(tags)
+    table = _table(spring_dtype, n, tag=tags, iNode=i_nodes, jNode=j_nodes,
+                   nmat=mats.shape[1], exposure=exposure)
+    table['mats'][:, :mats.shape[1]] = mats
+    table['dirs'][:, :dirs.shape[1]] = dirs
+    return table
+
+
+class BridgeGenerator:
+    """
+    Vectorized generator of the bridge tables for one variant.
+
+    Usage:
+        tables = ModelTables(BridgeGenerator(span_length_m=30, num_spans=3).tables())
+        build_model(fc, fy, scourDepth, tables=tables)
+    """
+
+    def __init__(self, span_length_m=35.0, num_spans=4, deck_width_m=12.0,
+                 column_height_m=8.7, shear_key_flips=reference_shear_key_flips):
+        if num_spans < 2:
+            raise ValueError("num_spans must be at least 2 (one bent)")
+        self.L = 1000.0 * span_length_m
+        self.N = int(num_spans)
+        self.W = 1000.0 * deck_width_m
+        self.H = 1000.0 * column_height_m
+        self.flips = set(shear_key_flips)
+
+        half = self.W / 2.0 - deck_overhang
+        girders = np.round(np.linspace(-half, half, num_girders), 1)
+        self.y_deck = np.insert(girders, num_girders // 2, 0.0)   # k = 1..9
+        self.y_bearing = girders                                   # k = 10..17
+
+        self.z_cap = -bearing_height
+        self.z_top = self.z_cap - cap_to_column
+        self.z_bottom = self.z_top - self.H
+        self.z_footing = self.z_bottom - footing_offset
+        self.z_head = self.z_footing - footing_offset
+        self.bents = np.arange(1, self.N)
+
+    @property
+    def ground_depth(self):
+        """
+        Depth of the pile heads below the deck (mm); pushover_analysis.LCol of this variant.
+        """
+        return -self.z_head
+
+    def x_bent(self, b):
+        return b * self.L
+
+    # ── Nodes ────────────────────────────────────────────────────
+
+    def abutment_nodes(self, g, x):
+        k = np.arange(1, 10)
+        tags = (g * 100 + k[:, None] + np.array([0, 30, 60])).ravel()
+        y = np.repeat(self.y_deck, 3)
+        return _table(node_dtype, len(tags), tag=tags, x=x, y=y, z=0.0)
+
+    def group_nodes(self, g, x):
+        deck = _table(node_dtype, 9, tag=g * 100 + np.arange(1, 10), x=x, y=self.y_deck, z=0.0)
+        bearing = _table(node_dtype, 8, tag=g * 100 + np.arange(10, 18), x=x,
+                         y=self.y_bearing, z=self.z_cap)
+        return np.concatenate([deck, bearing])
+
+    def spine_nodes(self, s):
+        i = np.arange(1, deck_segments)
+        x = np.round((s - 1) * self.L + i * self.L / deck_segments, 1)
+        return _table(node_dtype, len(i), tag=s * 100 + 90 + i, x=x, y=0.0, z=0.0)
+
+    def cap_nodes(self, b):
+        x = self.x_bent(b)
+        girders = _table(node_dtype, 8, tag=2000 + 100 * b + np.arange(10, 18), x=x,
+                         y=self.y_bearing, z=self.z_cap)
+        column = _table(node_dtype, 3, tag=5000 + 100 * b + np.array([51, 52, 1]), x=x,
+                        y=[-column_edge, column_edge, 0.0], z=self.z_cap)
+        return np.concatenate([girders, column])
+
+    def foundation_nodes(self, b):
+        x = self.x_bent(b)
+        column = _table(node_dtype, 3, tag=[3000 + 100 * b + 1, 3000 + 100 * b + 2, 4000 + 100 * b + 1],
+                        x=x, y=0.0, z=[self.z_top, self.z_bottom, self.z_footing])
+        footing = _table(node_dtype, 8, tag=6000 + 100 * b + np.arange(1, 9),
+                         x=x + np.append(pile_dx, [0.0, 0.0]),
+                         y=np.append(pile_dy, [-2500.0, 2500.0]), z=self.z_footing)
+        p = np.arange(1, 7)
+        heads = _table(node_dtype, 18,
+                       tag=(np.array([6000, 8000, 9000]) + 100 * b + 10 + p[:, None]).ravel(),
+                       x=np.repeat(x + pile_dx, 3), y=np.repeat(pile_dy, 3), z=self.z_head)
+        blocks = [column, footing, heads]
+        for layer, n in ((7, 30), (8, 29), (9, 29)):
+            dd = np.arange(1, n + 1)
+            tags = (layer * 100000 + b * 10000 + p[:, None] * 100 + dd).ravel()
+            blocks.append(_table(node_dtype, len(tags), tag=tags,
+                                 x=np.repeat(x + pile_dx, n), y=np.repeat(pile_dy, n),
+                                 z=np.tile(self.z_head - pile_offsets[:n], 6)))
+        return np.concatenate(blocks)
+
+    def nodes(self):
+        last = 2 * self.N
+        blocks = [self.abutment_nodes(1, 0.0)]
+        for b in self.bents:
+            blocks += [self.group_nodes(2 * b, self.x_bent(b)), self.spine_nodes(b),
+                       self.cap_nodes(b), self.group_nodes(2 * b + 1, self.x_bent(b))]
+        blocks += [self.abutment_nodes(last, self.x_bent(self.N)), self.spine_nodes(self.N)]
+        blocks += [self.foundation_nodes(b) for b in self.bents]
+        return np.concatenate(blocks)
+
+    # ── Restraints / constraints ─────────────────────────────────
+
+    def restraints(self):
+        blocks = []
+        for g in (1, 2 * self.N):
+            tags = (g * 100 + np.arange(1, 10)[:, None] + np.array([0, 30, 60])).ravel()
+            fix = np.tile([[0, 0, 1, 0, 0, 0], [0, 0, 1, 0, 1, 0], [1, 1, 1, 1, 1, 1]], (9, 1))
+            blocks.append(_table(restraint_dtype, len(tags), tag=tags, fix=fix))
+        p = np.arange(1, 7)
+        dd = np.arange(1, 30)
+        for b in self.bents:
+            blocks.append(_table(restraint_dtype, 6, tag=700000 + b * 10000 + p * 100 + 30,
+                                 fix=[1, 1, 1, 0, 0, 0]))
+            for layer, fix in ((8, [0, 0, 0, 1, 1, 1]), (9, [1, 1, 1, 1, 1, 1])):
+                heads = layer * 1000 + 100 * b + 10 + p
+                piles = layer * 100000 + b * 10000 + p[:, None] * 100 + dd
+                tags = np.column_stack([heads, piles]).ravel()
+                blocks.append(_table(restraint_dtype, len(tags), tag=tags, fix=fix))
+        return np.concatenate(blocks)
+
+    def constraints(self):
+        blocks = []
+        bearing = np.array(bearing_order)
+        for b in self.bents:
+            cap = 2000 + 100 * b + bearing
+            left, right = 200 * b, 200 * b + 100
+            blocks.append(_table(constraint_dtype, 8, retained=cap, constrained=left + bearing,
+                                 dofs=[0, 0, 1, 0, 0, 0]))
+            blocks.append(_table(constraint_dtype, 9, retained=left + np.arange(1, 10),
+                                 constrained=right + np.arange(1, 10), dofs=[1, 1, 1, 0, 0, 0]))
+            blocks.append(_table(constraint_dtype, 8, retained=cap, constrained=right + bearing,
+                                 dofs=[0, 0, 1, 0, 0, 0]))
+        p = np.arange(1, 7)
+        dd = np.arange(1, 30)
+        for b in self.bents:
+            blocks.append(_table(constraint_dtype, 6, retained=6000 + 100 * b + 10 + p,
+                                 constrained=8000 + 100 * b + 10 + p, dofs=[1, 1, 1, 0, 0, 0]))
+            piles = (b * 10000 + p[:, None] * 100 + dd).ravel()
+            blocks.append(_table(constraint_dtype, len(piles), retained=700000 + piles,
+                                 constrained=800000 + piles, dofs=[1, 1, 1, 0, 0, 0]))
+        return np.concatenate(blocks)
+
+    # ── Masses ───────────────────────────────────────────────────
+
+    def masses(self):
+        scale = (self.L / reference_span) * (self.W / reference_width)
+        spine_mass = round(deck_node_mass * scale, 3)
+        end_mass = round(spine_mass / 2.0, 3)
+        column_mass = round(column_node_mass * self.H / reference_column, 3)
+        cap_mass = round(cap_node_mass * self.W / reference_width, 3)
+        blocks = []
+        for s in range(1, self.N + 1):
+            tags = [(2 * s - 1) * 100 + 5, 2 * s * 100 + 5] + list(s * 100 + 90 + np.arange(1, deck_segments))
+            mass = [end_mass, end_mass] + [spine_mass] * (deck_segments - 1)
+            if s < self.N:
+                tags += [3000 + 100 * s + 1, 3000 + 100 * s + 2, 5000 + 100 * s + 1]
+                mass += [column_mass, column_mass, cap_mass]
+            m = np.asarray(mass)
+            blocks.append(_table(mass_dtype, len(tags), tag=tags,
+                                 mass=np.column_stack([m, m, m, 0 * m, 0 * m, 0 * m])))
+        return np.concatenate(blocks)
+
+    # ── Elements ─────────────────────────────────────────────────
+
+    def abutment_elements(self, g):
+        k = np.arange(1, 9)
+        tags = (g * 100 + k[:, None] + np.array([0, 30])).ravel()
+        return _elements('elasticBeamColumn', tags, tags, tags + 1, rigid_section, IDTransCap)
+
+    def group_elements(self, g):
+        base = g * 100
+        k = np.arange(1, 9)
+        transverse = _elements('elasticBeamColumn', base + k, base + k, base + k + 1,
+                               rigid_section, IDTransCap)
+        deck_k = np.array([1, 2, 3, 4, 9, 8, 7, 6])
+        offset = np.where(deck_k < 5, deck_k, deck_k - 1)
+        vertical = _elements('elasticBeamColumn', base + 8 + offset, base + deck_k,
+                             base + 9 + offset, rigid_section, IDTransCol)
+        return np.concatenate([transverse, vertical])
+
+    def cap_elements(self, b):
+        y = np.append(self.y_bearing, [-column_edge, column_edge, 0.0])
+        tags = np.append(2000 + 100 * b + np.arange(10, 18), 5000 + 100 * b + np.array([51, 52, 1]))
+        order = np.argsort(y, kind='stable')
+        y, tags = y[order], tags[order]
+        inside = (np.abs(y[:-1]) <= column_edge) & (np.abs(y[1:]) <= column_edge)
+        ele_tags = 2000 + 100 * b + np.arange(1, len(y))
+        rigid = _elements('elasticBeamColumn', ele_tags, tags[:-1], tags[1:], rigid_section, IDTransCap)
+        cap = _elements('elasticBeamColumn', ele_tags, tags[:-1], tags[1:], cap_section, IDTransCap)
+        return np.where(inside, rigid, cap)
+
+    def spine_elements(self, s):
+        nodes = np.concatenate([[(2 * s - 1) * 100 + 5], s * 100 + 90 + np.arange(1, deck_segments),
+                                [2 * s * 100 + 5]])
+        return _elements('elasticBeamColumn', s * 100 + 90 + np.arange(1, deck_segments + 1),
+                         nodes[:-1], nodes[1:], deck_section, IDTransDeck)
+
+    def foundation_elements(self, b):
+        column = _elements('nonlinearBeamColumn', [3000 + 100 * b + 1], [3000 + 100 * b + 1],
+                           [3000 + 100 * b + 2], column_section, IDTransCol)
+        stub = _elements('elasticBeamColumn', [4000 + 100 * b + 1], [3000 + 100 * b + 2],
+                         [4000 + 100 * b + 1], rigid_section, IDTransCol)
+        # footing nodes: 0 = 4b01, n = 6b0n
+        pairs = np.array([(1, 2), (2, 3), (8, 3), (4, 8), (5, 4), (6, 5), (6, 7), (7, 1),
+                          (0, 2), (5, 0), (0, 8), (7, 0)])
+        local = np.where(pairs == 0, 4000 + 100 * b + 1, 6000 + 100 * b + pairs)
+        ele = 60000 + 100 * b + np.arange(1, 13)
+        footing = _elements('elasticBeamColumn', ele, local[:, 0], local[:, 1], rigid_section, IDTransCap)
+        return np.concatenate([column, stub, footing])
+
+    def pile_elements(self, b):
+        """
+        Rigid link from the footing to each pile head (60b13..60b18), each followed
+        by the 30 elements of its pile, in the order of Element.py.
+        """
+        p = np.arange(1, 7)
+        heads = _elements('elasticBeamColumn', 60000 + 100 * b + 12 + p, 6000 + 100 * b + p,
+                          6000 + 100 * b + 10 + p, rigid_section, IDTransCol)
+        dd = np.arange(1, 31)
+        tags = 700000 + b * 10000 + p[:, None] * 100 + dd
+        i_nodes = np.column_stack([6000 + 100 * b + 10 + p, tags[:, :-1]])
+        piles = _elements('elasticBeamColumn', tags.ravel(), i_nodes.ravel(), tags.ravel(),
+                          pile_section, IDTransCol).reshape(6, 30)
+        return np.concatenate([heads[:, None], piles], axis=1).ravel()
+
+    def elements(self):
+        last = 2 * self.N
+        blocks = [_elements('elasticBeamColumn', 5000 + 100 * self.bents + 1,
+                            5000 + 100 * self.bents + 1, 3000 + 100 * self.bents + 1,
+                            rigid_section, IDTransCol),
+                  self.abutment_elements(1)]
+        for b in self.bents:
+            blocks += [self.group_elements(2 * b), self.cap_elements(b),
+                       self.spine_elements(b), self.group_elements(2 * b + 1)]
+        blocks += [self.abutment_elements(last), self.spine_elements(self.N)]
+        for b in self.bents:
+            blocks += [self.foundation_elements(b), self.pile_elements(b)]
+        return np.concatenate(blocks)
+
+    # ── Zero-length springs ──────────────────────────────────────
+
+    def abutment_spring_table(self, g, first):
+        k = np.array([1, 2, 3, 4, 6, 7, 8, 9])
+        role = {'d': g * 100 + k, 'm': g * 100 + 30 + k, 'f': g * 100 + 60 + k}
+        blocks = []
+        for typ, mat, dof, at_first, at_last in abutment_springs:
+            if at_first is None:
+                even = np.arange(len(k)) % 2 == 0
+                i_nodes = np.where(even, role['m'], role['d'])
+                j_nodes = np.where(even, role['d'], role['m'])
+            else:
+                ij = at_first if first else at_last
+                i_nodes, j_nodes = role[ij[0]], role[ij[1]]
+            blocks.append(_springs(typ * 1000 + g * 100 + k, i_nodes, j_nodes,
+                                   np.full((len(k), 1), mat), np.full((len(k), 1), dof)))
+        # springs of one deck node are consecutive
+        table = np.stack(blocks, axis=1).ravel()
+        return table
+
+    def bearing_spring_table(self, g):
+        b = g // 2
+        k = np.array(bearing_order)
+        cap, deck = 2000 + 100 * b + k, g * 100 + k
+        tags = [6000 + g * 100 + k, 7000 + g * 100 + k, 8000 + g * 100 + k]
+        # shear keys alternate cap -> deck / deck -> cap along the cap beam
+        key_cap_first = (k % 2 == 0) != np.isin(tags[2], list(self.flips))
+        rows = [
+            _springs(tags[0], cap, deck, np.full((8, 1), 51), np.full((8, 1), 1)),
+            _springs(tags[1], cap, deck, np.full((8, 1), 51), np.full((8, 1), 2)),
+            _springs(tags[2], np.where(key_cap_first, cap, deck), np.where(key_cap_first, deck, cap),
+                     np.full((8, 1), 54), np.full((8, 1), 2)),
+        ]
+        return np.stack(rows, axis=1).ravel()
+
+    def soil_spring_table(self, b):
+        p = np.arange(1, 7)[:, None]
+        dd = np.arange(0, 30)   # 0 = pile head (8b1p), dd = 8b0pdd
+        i_nodes = np.where(dd == 0, 8000 + 100 * b + 10 + p, 800000 + b * 10000 + p * 100 + dd)
+        j_nodes = np.where(dd == 0, 9000 + 100 * b + 10 + p, 900000 + b * 10000 + p * 100 + dd)
+        z = self.z_head - np.concatenate([[0.0], pile_offsets[:29]])
+        exposure = np.broadcast_to(-z, i_nodes.shape)
+        py_tags = np.where(dd == 0, 9000 + 100 * b + p, 20000 + 1000 * (b - 1) + 100 * p + dd)
+        tz_tags = np.where(dd == 0, 3000 + 100 * b + 10 + p, 30000 + 1000 * (b - 1) + 100 * p + dd)
+        py_mats = np.broadcast_to(101 + dd, i_nodes.shape).ravel()
+        tz_mats = np.broadcast_to(201 + dd, i_nodes.shape).ravel()
+        py = _springs(py_tags.ravel(), i_nodes.ravel(), j_nodes.ravel(),
+                      np.column_stack([py_mats, py_mats]), np.tile([1, 2], (py_mats.size, 1)),
+                      exposure.ravel())
+        tz = _springs(tz_tags.ravel(), i_nodes.ravel(), j_nodes.ravel(),
+                      tz_mats[:, None], np.full((tz_mats.size, 1), 3), exposure.ravel())
+        return np.concatenate([py, tz])
+
+    def springs(self):
+        last = 2 * self.N
+        blocks = [self.abutment_spring_table(1, first=True)]
+        blocks += [self.bearing_spring_table(g) for g in range(2, last)]
+        blocks += [self.abutment_spring_table(last, first=False)]
+        blocks += [self.soil_spring_table(b) for b in self.bents]
+        return np.concatenate(blocks)
+
+    # ── Gravity loads ────────────────────────────────────────────
+
+    def node_loads(self):
+        n = len(self.bents)
+        load = np.zeros((n, 6))
+        load[:, 2] = -round(pier_load * self.H / reference_column, 3)
+        return _table(node_load_dtype, n, tag=5000 + 100 * self.bents + 1, load=load)
+
+    def beam_loads(self):
+        w_deck = round(deck_load * self.W / reference_width, 3)
+        blocks = []
+        for s in range(1, self.N + 1):
+            if s < self.N:
+                blocks.append(_table(beam_load_dtype, 10, tag=2000 + 100 * s + np.arange(1, 11),
+                                     wy=0.0, wz=cap_beam_load))
+            blocks.append(_table(beam_load_dtype, deck_segments,
+                                 tag=s * 100 + 90 + np.arange(1, deck_segments + 1),
+                                 wy=0.0, wz=w_deck))
+        return np.concatenate(blocks)
+
+    def tables(self):
+        """
+        The tables of model_data.ModelTables for this bridge.
+        """
+        arrays = {'nodes': self.nodes(), 'restraints': self.restraints(),
+                  'constraints': self.constraints(), 'masses': self.masses(),
+                  'elements': self.elements(), 'springs': self.springs(),
+                  'node_loads': self.node_loads(), 'beam_loads': self.beam_loads()}
+        for name, field in (('nodes', 'tag'), ('elements', 'tag')):
+            if len(np.unique(arrays[name][field])) != len(arrays[name]):
+                raise ValueError(f"{name}: tag scheme overflows for {self.N} spans")
+        ele_tags = np.concatenate([arrays['elements']['tag'], arrays['springs']['tag']])
+        if len(np.unique(ele_tags)) != len(ele_tags):
+            raise ValueError(f"element tags overflow for {self.N} spans")
+        return arrays
+
+
+def generate_bridge(span_length_m=35.0, num_spans=4, deck_width_m=12.0, column_height_m=8.7,
+                    shear_key_flips=reference_shear_key_flips):
+    """
+    Tables of one bridge variant (dict of structured arrays, see model_data).
+    """
+    return BridgeGenerator(span_length_m, num_spans, deck_width_m, column_height_m,
+                           shear_key_flips).tables()
+
+
+def generate_bridge_from_parameters(path=None, **overrides):
+    """
+    Tables of the bridge described by parameters.py (span_length_m, num_spans,
+    deck_width_m, column_height_m); keyword arguments override single values.
+    """
+    path = path or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'parameters.py')
+    params = runpy.run_path(path)
+    geometry = {name: params[name] for name in
+                ('span_length_m', 'num_spans', 'deck_width_m', 'column_height_m')}
+    geometry.update(overrides)
+    return generate_bridge(**geometry)
@@ -0,0 +1,299 @@
+# campaign.py
+# Runs the pushover samples of every scenario sheet on a pool of worker
+# processes. Each worker holds its own OpenSees domain and writes its recorders
+# to RecorderData/{label}/scour_*.
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from campaign_manifest import CampaignManifest, FINISHED
+from campaign_store import CampaignStore, response_fields, yield_dtype
+from pushover_analysis import run_sample
+
+
+def read_scenario_samples(excel_path, scenario_sheets):
+    """
+    Reads the LHS sample sheets of each scenario.
+
+    Parameters:
+        excel_path (str or Path): Workbook holding one sheet per scenario with the
+                                  columns "Scour_Depth_mm", "fc'_MPa" and "fy_MPa".
+        scenario_sheets (dict): Mapping of scenario label -> sheet name.
+
+    Returns:
+        dict: Mapping of scenario label -> DataFrame of samples.
+    """
+    return {label: pd.read_excel(excel_path, sheet_name=sheet_name)
+            for label, sheet_name in scenario_sheets.items()}
+
+
+def read_store_design(store, scenarios=None):
+    """
+    Reads the sampling designs written to a campaign store (see
+    scour_hazard.write_scour_material_designs), in the layout of read_scenario_samples.
+
+    Parameters:
+        store (str): Path of the HDF5 campaign store.
+        scenarios (iterable or None): Scenario labels; default every scenario with a design.
+
+    Returns:
+        dict: Mapping of scenario label -> DataFrame of samples.
+    """
+    with CampaignStore(store, 'r') as s:
+        names = scenarios or [name for name in s.scenarios() if 'design' in s.file[name]]
+        return {name: s.read_design(name) for name in names}
+
+
+def write_store_yields(store, scenarios=None, num_grid=200):
+    """
+    Fits the bilinear yield point of every stored response that has none yet and
+    appends the yield tuples to the store (CampaignStore.write_yields), in the
+    layout of Yield_Results_by_Scenario.xlsx. The curves of a scenario are fitted
+    in one fit_bilinear_profile_batch call (fit_bilinear_profile.py at the
+    repository root, so run from there, e.g. python -m BridgeModeling.campaign).
+    A fit whose k2 is not finite or not above -k1, or whose dy is not inside the
+    recorded drift, is stored with status 'rejected' and NaN fit values, so it is
+    neither used nor fitted again; the others get status 'ok'.
+
+    Parameters:
+        store (str): Path of the HDF5 campaign store, written with capture=True.
+        scenarios (iterable or None): Scenario labels; default every scenario.
+        num_grid (int): Breakpoint grid of the fit (see fit_bilinear_profile).
+
+    Returns:
+        pd.DataFrame: The yield rows written, with a "Scenario" column.
+    """
+    from fit_bilinear_profile import fit_bilinear_profile_batch
+
+    frames = []
+    with CampaignStore(store) as s:
+        for name in scenarios or s.scenarios():
+            if 'samples' not in s.file[name]:
+                continue
+            fitted = set(s.read_yields(name)['sample'])
+            rows = s.read_samples(name)
+            rows = rows[(rows['status'] == 'done') & (rows['length'] > 0)
+                        & ~rows['sample'].isin(fitted)]
+            if rows.empty:
+                continue
+            dset = s.file[name]['response']
+            responses = [dset[start:start + length]
+                         for start, length in zip(rows['start'], rows['length'])]
+            d, V, M, theta = (response_fields.index(k) for k in ('d', 'V', 'M', 'theta'))
+            k1, k2, dy, Vy = fit_bilinear_profile_batch([(r[:, d], r[:, V]) for r in responses],
+                                                        num_grid=num_grid)
+            d_max = np.array([r[:, d].max() for r in responses])
+            with np.errstate(invalid='ignore'):
+                ok = np.isfinite(k1) & np.isfinite(k2) & (k2 > -k1) & (dy < d_max)
+            k1, k2, dy, Vy = (np.where(ok, x, np.nan) for x in (k1, k2, dy, Vy))
+            # Moment and rotation at the recorded step nearest to dy (Processing and Plotting.ipynb)
+            at_dy = [np.argmin(np.abs(r[:, d] - y)) if np.isfinite(y) else None
+                     for r, y in zip(responses, dy)]
+            df = pd.DataFrame({
+                'sample': rows['sample'].values,
+                'Scour_Depth_mm': rows['scour_depth_mm'].values,
+                'dy_mm': dy,
+                'Vy_kN': Vy,
+                'My_kNm': [np.nan if i is None else r[i, M] for r, i in zip(responses, at_dy)],
+                'Thy_rad': [np.nan if i is None else r[i, theta] for r, i in zip(responses, at_dy)],
+                'k1_kN_per_mm': k1,
+                'k2_kN_per_mm': k2,
+                'status': np.where(ok, 'ok', 'rejected'),
+            })
+            s.write_yields(name, df)
+            df.insert(0, 'Scenario', name)
+            frames.append(df)
+    if not frames:
+        return pd.DataFrame(columns=['Scenario'] + list(yield_dtype.names))
+    return pd.concat(frames, ignore_index=True)
+
+
+def campaign_tasks(scenario_samples):
+    """
+    Flattens the scenario sheets into (label, sample_id, scour_depth_mm, fc, fy) tasks.
+    """
+    tasks = []
+    for label, df in scenario_samples.items():
+        for i, row in df.iterrows():
+            tasks.append((label, i, float(row["Scour_Depth_mm"]),
+                          float(row["fc'_MPa"]), float(row["fy_MPa"])))
+    return tasks
+
+
+def error_status(task, message):
+    """
+    Status row of a sample that raised in (or killed) its worker.
+    """
+    label, sample_id, scour_depth_mm, fc, fy = task
+    return {
+        'scenario': label,
+        'sample': sample_id,
+        'scour_depth_mm': scour_depth_mm,
+        'fc': fc,
+        'fy': fy,
+        'status': 'error',
+        'error': message,
+    }
+
+
+def run_pool(tasks, n_workers, sample_kwargs, finish):
+    """
+    Runs tasks with run_sample on a new process pool and calls finish(task, status)
+    for every sample that returned or raised.
+
+    Returns:
+        list: The tasks left unfinished because a worker process died (an
+              OpenSees abort breaks the whole pool), in submission order.
+    """
+    broken = []
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = {pool.submit(run_sample, *task, **sample_kwargs): task for task in tasks}
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                status = future.result()
+            except BrokenProcessPool:
+                broken.append(task)
+                continue
+            except Exception as e:
+                status = error_status(task, str(e))
+            finish(task, status)
+    order = {task: i for i, task in enumerate(tasks)}
+    return sorted(broken, key=order.get)
+
+
+def run_campaign(scenario_samples, n_workers=None, out_root='RecorderData', binary=False,
+                 capture=False, store=None, manifest=None, retry_failed=False,
+                 template=False, adaptive=False, solver=None, retry_pushover=False,
+                 verbose=False):
+    """
+    Runs every (scenario, sample) pushover on a pool of worker processes.
+
+    Parameters:
+        scenario_samples (dict): Mapping of scenario label -> DataFrame of samples,
+                                 e.g. from read_scenario_samples().
+        n_workers (int or None): Number of worker processes. Defaults to os.cpu_count().
+        out_root (str): Root of the recorder output tree; each sample writes to
+                        {out_root}/{label}/scour_{depth}_s{sample}.
+        binary (bool): Write binary recorder files (see RecorderColFiber.read_pushover_response).
+        capture (bool): Capture the responses in memory instead of recorder files;
+                        each row then carries its history under "response".
+        store (str or None): Path of an HDF5 campaign store (see campaign_store.py).
+                             Every finished sample is appended as soon as it
+                             completes; captured histories and the per-step
+                             solver tables go to the store instead of the
+                             returned rows.
+        manifest (str or None): Path of a campaign manifest (see campaign_manifest.py).
+                                Workers record each sample's status there, and
+                                samples that already finished are skipped, so an
+                                interrupted campaign resumes where it stopped.
+        retry_failed (bool): With a manifest, also rerun samples that finished
+                             with status 'failed' or 'gravity_failed'.
+        template (bool): Let every worker build the model once and re-target it
+                         per sample (see model_setup.ModelTemplate).
+        adaptive (bool): Adaptive pushover increments (see
+                         pushover_analysis.run_adaptive_pushover).
+        solver (tuple or None): (system, numberer) of the analyses, e.g.
+                                ('UmfPack', 'RCM'); None takes Parameters.py.
+        retry_pushover (bool): Rerun a failed pushover once from the restored
+                               post-gravity state with the other stepping (see
+                               pushover_analysis.run_sample).
+        verbose (bool): Forward the per-sample progress prints of the workers.
+
+    Returns:
+        pd.DataFrame: One status row per sample run in this call (see
+                      pushover_analysis.run_sample), sorted by scenario and sample.
+                      Samples that raised in the worker get status 'error' and the
+                      message in "error"; so do samples that killed their worker
+                      process (e.g. an OpenSees abort), after the remaining
+                      samples were resubmitted to a new pool (see run_pool).
+    """
+    tasks = campaign_tasks(scenario_samples)
+    n_workers = n_workers or os.cpu_count()
+
+    campaign_manifest = None
+    if manifest:
+        campaign_manifest = CampaignManifest(manifest)
+        skip = campaign_manifest.finished(('done',) if retry_failed else FINISHED)
+        if capture and store and os.path.exists(store):
+            # Captured histories only exist once the parent stored them.
+            with CampaignStore(store, 'r') as s:
+                stored = {(name, int(i)) for name in s.scenarios()
+                          for i in s.read_samples(name)['sample']}
+            skip &= stored
+        n_total = len(tasks)
+        tasks = [task for task in tasks if (task[0], task[1]) not in skip]
+        print(f"⏭️ Resuming: {n_total - len(tasks)} of {n_total} samples already finished")
+
+    records = []
+    campaign_store = CampaignStore(store) if store else None
+
+    def finish(task, status):
+        label, sample_id, scour_depth_mm, fc, fy = task
+        if status['status'] == 'error' and campaign_manifest is not None:
+            campaign_manifest.mark(label, sample_id, 'error')
+        if campaign_store is not None:
+            campaign_store.append_sample(label, sample_id, scour_depth_mm, fc, fy,
+                                         status=status['status'],
+                                         fallback=status.get('fallback'),
+                                         response=status.pop('response', None))
+            if 'steps' in status:
+                campaign_store.append_telemetry(label, sample_id, status,
+                                                status.pop('steps'))
+        records.append(status)
+        print(f"[{len(records)}/{len(tasks)}] {label} | Sample {sample_id+1}: {status['status']}")
+
+    sample_kwargs = dict(out_root=out_root, binary=binary, capture=capture, manifest=manifest,
+                         template=template, adaptive=adaptive, solver=solver,
+                         retry_pushover=retry_pushover, verbose=verbose)
+    pending = tasks
+    while pending:
+        broken = run_pool(pending, n_workers, sample_kwargs, finish)
+        if not broken:
+            break
+        # The pool hands out tasks in submission order, so the sample that killed
+        # a worker is among the first n_workers + 1 unfinished ones (those in a
+        # worker or in the call queue). Each of them reruns alone; one that kills
+        # its own worker again is recorded as 'error', the rest go to a new pool.
+        suspects, pending = broken[:n_workers + 1], broken[n_workers + 1:]
+        print(f"⚠️ A worker process died: rerunning {len(suspects)} samples one by one "
+              f"and {len(pending)} on a new pool")
+        for task in suspects:
+            if run_pool([task], 1, sample_kwargs, finish):
+                finish(task, error_status(task, 'worker process died'))
+
+    if campaign_store is not None:
+        campaign_store.close()
+    if campaign_manifest is not None:
+        campaign_manifest.close()
+    if not records:
+        return pd.DataFrame(columns=['scenario', 'sample', 'status'])
+    return pd.DataFrame(records).sort_values(['scenario', 'sample']).reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    # === Auto-load the latest Excel ===
+    result_dir = Path("RecorderData/results")
+    excel_path = max(result_dir.glob("Scour_Materials_*.xlsx"), key=lambda f: f.stat().st_mtime)
+    print(f"📂 Using Excel file: {excel_path.name}")
+
+    # === Scenario sheet mapping ===
+    scenario_sheets = {
+        "Missouri": "Scenario_1_Missouri_River",
+        "Colorado": "Scenario_2_Colorado_River",
+        "Extreme": "Scenario_3_Extreme_Case"
+    }
+
+    samples = read_scenario_samples(excel_path, scenario_sheets)
+    status = run_campaign(samples, n_workers=os.cpu_count(), capture=True, template=True,
+                          adaptive=True,
+                          store="RecorderData/campaign.h5",
+                          manifest="RecorderData/campaign_manifest.sqlite")
+    print(status.groupby(['scenario', 'status']).size())
+    yields = write_store_yields("RecorderData/campaign.h5")
+    print(f"📈 {len(yields)} yield points written to the store")
+    print("✅ All scenarios processed.")
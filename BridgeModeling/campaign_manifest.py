@@ -0,0 +1,91 @@
+# campaign_manifest.py
+# Checkpoint manifest of a pushover campaign: one row per (scenario, sample) with
+# its status, so that a campaign that was killed or pre-empted resumes where it
+# stopped. The manifest is a SQLite database in WAL mode; every worker process
+# opens its own connection and SQLite serialises the concurrent writes.
+import sqlite3
+import time
+
+# Statuses written by pushover_analysis.run_sample / campaign.run_campaign
+RUNNING = 'running'
+FINISHED = ('done', 'failed', 'gravity_failed')
+
+_connections = {}  # one connection per manifest path and process
+
+
+class CampaignManifest:
+    """
+    Per-sample status table of a campaign.
+
+    Usage:
+        manifest = CampaignManifest("RecorderData/campaign_manifest.sqlite")
+        manifest.mark("Extreme", 12, "running")
+        manifest.mark("Extreme", 12, "done", fallback="NormDispIncr + KrylovNewton")
+        finished = manifest.finished()
+    """
+
+    def __init__(self, path, timeout=60.0):
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS samples ("
+            " scenario TEXT NOT NULL,"
+            " sample INTEGER NOT NULL,"
+            " status TEXT NOT NULL,"
+            " fallback TEXT,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " updated REAL NOT NULL,"
+            " PRIMARY KEY (scenario, sample))"
+        )
+
+    def close(self):
+        self.conn.close()
+
+    def mark(self, scenario, sample, status, fallback=None):
+        """
+        Records the status of a sample; marking it 'running' counts an attempt.
+        """
+        attempt = 1 if status == RUNNING else 0
+        self.conn.execute(
+            "INSERT INTO samples (scenario, sample, status, fallback, attempts, updated)"
+            " VALUES (?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (scenario, sample) DO UPDATE SET"
+            " status = excluded.status, fallback = excluded.fallback,"
+            " attempts = attempts + excluded.attempts, updated = excluded.updated",
+            (scenario, int(sample), status, fallback, attempt, time.time()),
+        )
+
+    def status(self, scenario, sample):
+        row = self.conn.execute(
+            "SELECT status FROM samples WHERE scenario = ? AND sample = ?",
+            (scenario, int(sample)),
+        ).fetchone()
+        return row[0] if row else None
+
+    def finished(self, statuses=FINISHED):
+        """
+        Set of (scenario, sample) whose status is in statuses.
+        """
+        marks = ",".join("?" * len(statuses))
+        rows = self.conn.execute(
+            f"SELECT scenario, sample FROM samples WHERE status IN ({marks})", tuple(statuses)
+        ).fetchall()
+        return set(rows)
+
+    def summary(self):
+        """
+        The whole manifest as a DataFrame.
+        """
+        import pandas as pd  # only needed here; keeps worker start-up light
+        return pd.read_sql_query("SELECT * FROM samples ORDER BY scenario, sample", self.conn)
+
+
+def mark_sample(path, scenario, sample, status, fallback=None):
+    """
+    Marks a sample in the manifest at path, reusing this process' connection.
+    """
+    if path not in _connections:
+        _connections[path] = CampaignManifest(path)
+    _connections[path].mark(scenario, sample, status, fallback)
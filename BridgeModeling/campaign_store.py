@@ -0,0 +1,321 @@
+# campaign_store.py
+# Single chunked, compressed HDF5 store for a pushover campaign. It replaces the
+# per-sample RecorderData/{Scenario}/scour_*/ folders and the
+# Yield_Results_by_Scenario.xlsx workbook.
+#
+# Layout (one group per scenario):
+#   /{scenario}/design    table: sample, scour_depth_mm, fc, fy of the sampling
+#                         design (scour_hazard.write_scour_material_designs)
+#   /{scenario}/samples   table: sample, scour_depth_mm, fc, fy, status, fallback,
+#                         start, length  (start/length index into response)
+#   /{scenario}/response  (n_steps_total, 5) float64: time, d, V, M, theta
+#                         (all samples back to back, CSR style)
+#   /{scenario}/yield     table: sample, Scour_Depth_mm, dy_mm, Vy_kN, My_kNm,
+#                         Thy_rad, k1_kN_per_mm, k2_kN_per_mm of the bilinear
+#                         fit of each response, status ('ok', or 'rejected' with
+#                         NaN fit values) (campaign.write_store_yields)
+#   /{scenario}/telemetry table: sample, build_s, gravity_s, pushover_s, n_steps,
+#                         n_failed, iterations, max_iterations, start, length
+#                         (start/length index into steps)
+#   /{scenario}/steps     table: phase, algorithm, ok, iterations, norm, disp,
+#                         wall_s of every analyze() attempt (solver_telemetry.py)
+# Every append resizes the datasets and flushes, so a campaign can write into the
+# store while it runs and a crash loses at most the sample in flight.
+import h5py
+import numpy as np
+import pandas as pd
+
+response_fields = ('time', 'd', 'V', 'M', 'theta')
+
+sample_dtype = np.dtype([
+    ('sample', np.int64),
+    ('scour_depth_mm', np.float64),
+    ('fc', np.float64),
+    ('fy', np.float64),
+    ('status', 'S16'),
+    ('fallback', h5py.string_dtype()),  # every "test + algorithm" used, "; "-joined
+    ('start', np.int64),
+    ('length', np.int64),
+])
+
+yield_dtype = np.dtype([
+    ('sample', np.int64),
+    ('Scour_Depth_mm', np.float64),
+    ('dy_mm', np.float64),
+    ('Vy_kN', np.float64),
+    ('My_kNm', np.float64),
+    ('Thy_rad', np.float64),
+    ('k1_kN_per_mm', np.float64),
+    ('k2_kN_per_mm', np.float64),
+    ('status', 'S16'),
+])
+
+design_dtype = np.dtype([
+    ('sample', np.int64),
+    ('scour_depth_mm', np.float64),
+    ('fc', np.float64),
+    ('fy', np.float64),
+])
+
+# design_dtype field -> column of the Scour_Materials_*.xlsx sheets
+design_columns = {'scour_depth_mm': 'Scour_Depth_mm', 'fc': "fc'_MPa", 'fy': 'fy_MPa'}
+
+telemetry_dtype = np.dtype([
+    ('sample', np.int64),
+    ('build_s', np.float64),
+    ('gravity_s', np.float64),
+    ('pushover_s', np.float64),
+    ('n_steps', np.int64),
+    ('n_failed', np.int64),
+    ('iterations', np.int64),
+    ('max_iterations', np.int64),
+    ('start', np.int64),
+    ('length', np.int64),
+])
+
+CHUNK_ROWS = 4096
+
+
+def _decode(df):
+    # HDF5 fixed-length strings come back as bytes
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].str.decode('utf-8')
+    return df
+
+
+class CampaignStore:
+    """
+    HDF5 campaign store keyed by scenario and sample ID.
+
+    Usage:
+        with CampaignStore("RecorderData/campaign.h5") as store:
+            store.append_sample("Extreme", 0, 3000.0, 27.0, 420.0, response=resp)
+            df = store.read_samples("Extreme")
+    """
+
+    def __init__(self, path, mode='a'):
+        self.path = path
+        self.file = h5py.File(path, mode)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    # ── Writing ──────────────────────────────────────────────────
+
+    def _group(self, scenario):
+        if scenario in self.file:
+            return self.file[scenario]
+        grp = self.file.create_group(scenario)
+        grp.create_dataset('samples', shape=(0,), maxshape=(None,), dtype=sample_dtype,
+                           chunks=(CHUNK_ROWS,), compression='gzip', shuffle=True)
+        grp.create_dataset('response', shape=(0, len(response_fields)),
+                           maxshape=(None, len(response_fields)), dtype=np.float64,
+                           chunks=(CHUNK_ROWS, len(response_fields)),
+                           compression='gzip', shuffle=True)
+        grp.create_dataset('yield', shape=(0,), maxshape=(None,), dtype=yield_dtype,
+                           chunks=(CHUNK_ROWS,), compression='gzip', shuffle=True)
+        return grp
+
+    @staticmethod
+    def _table(grp, name, dtype):
+        # tables added after the first stores were written are created on first use
+        if name not in grp:
+            grp.create_dataset(name, shape=(0,), maxshape=(None,), dtype=dtype,
+                               chunks=(CHUNK_ROWS,), compression='gzip', shuffle=True)
+        return grp[name]
+
+    @staticmethod
+    def _append(dset, rows):
+        n = dset.shape[0]
+        dset.resize(n + len(rows), axis=0)
+        dset[n:] = rows
+        return n
+
+    def append_sample(self, scenario, sample, scour_depth_mm, fc, fy,
+                      status='done', fallback=None, response=None):
+        """
+        Appends one sample (inputs, status and optional response history).
+
+        Parameters:
+            response (dict or None): time/d/V/M/theta arrays, e.g. from
+                                     ResponseCapture.response() or read_pushover_response().
+        """
+        grp = self._group(scenario)
+        start, length = -1, 0
+        if response is not None:
+            block = np.column_stack([np.asarray(response[k], dtype=np.float64)
+                                     for k in response_fields])
+            start, length = self._append(grp['response'], block), len(block)
+
+        row = np.zeros(1, dtype=sample_dtype)
+        row['sample'] = sample
+        row['scour_depth_mm'] = scour_depth_mm
+        row['fc'] = fc
+        row['fy'] = fy
+        row['status'] = status or ''
+        row['fallback'] = fallback or ''
+        row['start'] = start
+        row['length'] = length
+        self._append(grp['samples'], row)
+        self.file.flush()
+
+    def append_telemetry(self, scenario, sample, summary, steps=None):
+        """
+        Appends the solver record of one sample.
+
+        Parameters:
+            summary (dict): Holds the fields of telemetry_dtype other than sample,
+                            start and length, e.g. a run_sample() status.
+            steps (np.ndarray or None): Per-attempt table, SolverTelemetry.steps().
+        """
+        grp = self._group(scenario)
+        start, length = -1, 0
+        if steps is not None and len(steps):
+            start, length = self._append(self._table(grp, 'steps', steps.dtype), steps), len(steps)
+
+        row = np.zeros(1, dtype=telemetry_dtype)
+        for name in telemetry_dtype.names[1:-2]:
+            row[name] = summary.get(name, 0)
+        row['sample'] = sample
+        row['start'] = start
+        row['length'] = length
+        self._append(self._table(grp, 'telemetry', telemetry_dtype), row)
+        self.file.flush()
+
+    def write_design(self, scenario, df, start=0):
+        """
+        Writes the sampling design of a scenario.
+
+        Parameters:
+            df (pd.DataFrame): Columns "Scour_Depth_mm", "fc'_MPa" and "fy_MPa"
+                               (the Excel sheet layout); the row order gives the
+                               sample IDs start, start + 1, ...
+            start (int): 0 replaces any previous design; otherwise the rows extend
+                         a design of exactly start samples (e.g. the next points
+                         of a QMC sequence, see scour_hazard.QMC_design).
+        """
+        grp = self._group(scenario)
+        if start == 0 and 'design' in grp:
+            del grp['design']
+        dset = self._table(grp, 'design', design_dtype)
+        if dset.shape[0] != start:
+            raise ValueError(f"Design of {scenario!r} has {dset.shape[0]} samples, "
+                             f"cannot extend it from sample {start}")
+        rows = np.zeros(len(df), dtype=design_dtype)
+        rows['sample'] = start + np.arange(len(df))
+        for name, column in design_columns.items():
+            rows[name] = df[column].values
+        self._append(dset, rows)
+        self.file.flush()
+
+    def write_yields(self, scenario, df):
+        """
+        Appends yield tuples; df holds the columns of yield_dtype (missing ones are
+        NaN, or empty for status). Stores written before the status column keep
+        their table layout.
+        """
+        dset = self._group(scenario)['yield']
+        rows = np.zeros(len(df), dtype=dset.dtype)
+        for name in dset.dtype.names:
+            if name in df:
+                rows[name] = df[name].values
+            elif dset.dtype[name].kind == 'f':
+                rows[name] = np.nan
+        self._append(dset, rows)
+        self.file.flush()
+
+    # ── Reading ──────────────────────────────────────────────────
+
+    def scenarios(self):
+        return list(self.file.keys())
+
+    def read_samples(self, scenario, samples=None):
+        """
+        Sample table of a scenario (latest row per sample), optionally only the given sample IDs.
+        """
+        df = _decode(pd.DataFrame(self.file[scenario]['samples'][:]))
+        df = df.drop_duplicates('sample', keep='last')
+        if samples is not None:
+            df = df[df['sample'].isin(samples)]
+        return df.sort_values('sample').reset_index(drop=True)
+
+    def read_response(self, scenario, sample):
+        """
+        Response history of one sample as a dict of arrays (None if not stored).
+        """
+        row = self.read_samples(scenario, [sample])
+        if row.empty or row['length'].iloc[0] == 0:
+            return None
+        start, length = int(row['start'].iloc[0]), int(row['length'].iloc[0])
+        block = self.file[scenario]['response'][start:start + length]
+        return {k: block[:, i] for i, k in enumerate(response_fields)}
+
+    def iter_responses(self, scenario, samples=None):
+        """
+        Yields (sample, response dict) for the stored histories of a scenario.
+        """
+        for _, row in self.read_samples(scenario, samples).iterrows():
+            if row['length'] > 0:
+                yield int(row['sample']), self.read_response(scenario, int(row['sample']))
+
+    def read_design(self, scenario):
+        """
+        Sampling design of a scenario in the Excel sheet layout ("Scour_Depth_mm",
+        "fc'_MPa", "fy_MPa"), indexed by sample ID.
+        """
+        df = pd.DataFrame(self.file[scenario]['design'][:])
+        return df.set_index('sample').rename(columns=design_columns).rename_axis(None)
+
+    def read_telemetry(self, scenario=None):
+        """
+        Solver summary per sample (latest row per sample), of one scenario or of
+        all scenarios with a "Scenario" column.
+        """
+        names = [scenario] if scenario else self.scenarios()
+        frames = []
+        for name in names:
+            if 'telemetry' not in self.file[name]:
+                continue
+            df = pd.DataFrame(self.file[name]['telemetry'][:])
+            df.insert(0, 'Scenario', name)
+            frames.append(df)
+        if not frames:
+            return pd.DataFrame(columns=['Scenario'] + list(telemetry_dtype.names))
+        df = pd.concat(frames, ignore_index=True)
+        return df.drop_duplicates(['Scenario', 'sample'], keep='last').reset_index(drop=True)
+
+    def read_steps(self, scenario, sample):
+        """
+        Per-attempt solver table of one sample as a DataFrame (None if not stored).
+        """
+        row = self.read_telemetry(scenario)
+        row = row[row['sample'] == sample]
+        if row.empty or row['length'].iloc[0] == 0:
+            return None
+        start, length = int(row['start'].iloc[0]), int(row['length'].iloc[0])
+        return _decode(pd.DataFrame(self.file[scenario]['steps'][start:start + length]))
+
+    def read_yields(self, scenario=None):
+        """
+        Yield tuples of one scenario, or of all scenarios with a "Scenario" column
+        (the layout of Yield_Results_by_Scenario.xlsx concatenated over its sheets).
+        """
+        names = [scenario] if scenario else self.scenarios()
+        frames = []
+        for name in names:
+            df = _decode(pd.DataFrame(self.file[name]['yield'][:]))
+            df.insert(0, 'Scenario', name)
+            frames.append(df)
+        if not frames:
+            return pd.DataFrame(columns=['Scenario'] + list(yield_dtype.names))
+        df = pd.concat(frames, ignore_index=True)
+        return df.drop_duplicates(['Scenario', 'sample'], keep='last').reset_index(drop=True)
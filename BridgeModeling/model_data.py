@@ -0,0 +1,348 @@
+# model_data.py
+# Array-backed model tables. Node.py, Restraint.py, Constraint.py, Mass.py,
+# Element.py, ZeroLengthElement.py and GravityLoad.py hold the bridge as literal
+# lists of Python tuples; here the same tables are kept as typed NumPy structured
+# arrays and cached in model_tables.npz, so a worker process loads a handful of
+# arrays instead of importing ~6,000 tuple literals. bridge_generator.py builds
+# the same tables for other bridge geometries.
+#
+# The cache is rebuilt from the literal modules whenever their content changes
+# (a hash of the sources is stored in the .npz).
+import ast
+import hashlib
+import os
+
+import numpy as np
+import openseespy.opensees as ops
+
+here = os.path.dirname(os.path.abspath(__file__))
+MODEL_TABLES_PATH = os.path.join(here, 'model_tables.npz')
+source_modules = ('Node.py', 'Restraint.py', 'Constraint.py', 'Mass.py',
+                  'Element.py', 'ZeroLengthElement.py', 'GravityLoad.py')
+
+node_dtype = np.dtype([('tag', np.int64), ('x', np.float64), ('y', np.float64),
+                       ('z', np.float64)])
+restraint_dtype = np.dtype([('tag', np.int64), ('fix', np.int8, (6,))])
+# dofs is a 0/1 mask over the 6 DOFs of the equalDOF
+constraint_dtype = np.dtype([('retained', np.int64), ('constrained', np.int64),
+                             ('dofs', np.int8, (6,))])
+mass_dtype = np.dtype([('tag', np.int64), ('mass', np.float64, (6,))])
+# args holds the nargs section / stiffness arguments between jNode and the transf tag
+element_dtype = np.dtype([('type', 'S24'), ('tag', np.int64), ('iNode', np.int64),
+                          ('jNode', np.int64), ('nargs', np.int8),
+                          ('args', np.float64, (6,)), ('transf', np.int64)])
+# exposure = largest scourDepth at which the spring still exists (inf if never scoured)
+spring_dtype = np.dtype([('tag', np.int64), ('iNode', np.int64), ('jNode', np.int64),
+                         ('nmat', np.int8), ('mats', np.int64, (2,)),
+                         ('dirs', np.int64, (2,)), ('exposure', np.float64)])
+# gravity pattern: nodal loads and -beamUniform element loads (Wy, Wz)
+node_load_dtype = np.dtype([('tag', np.int64), ('load', np.float64, (6,))])
+beam_load_dtype = np.dtype([('tag', np.int64), ('wy', np.float64), ('wz', np.float64)])
+
+# Element types whose arguments are integers (number of integration points, section tag)
+integer_arg_elements = {'nonlinearBeamColumn'}
+
+
+class SpringDepthIndex:
+    """
+    Scour index of a list or table of zero-length springs.
+
+    Each entry has an exposure depth e, the largest scourDepth at which it still
+    exists (inf for entries without soil mats); a spring is scoured when
+    scourDepth > e. The entries are kept sorted by e, so the active set at any
+    scour depth is one searchsorted slice.
+    """
+
+    def __init__(self, defs, exposure, tags):
+        self.defs = defs
+        exposure = np.asarray(exposure, dtype=np.float64)
+        self.order = np.argsort(exposure, kind="stable")  # rows in exposure order
+        self.exposure = exposure[self.order]
+        self.tags = np.asarray(tags)
+
+    def active_rows(self, scourDepth):
+        """
+        Rows of defs still present at scourDepth, in their original order.
+        """
+        start = np.searchsorted(self.exposure, scourDepth, side="left")
+        return np.sort(self.order[start:])
+
+    def exposed_rows(self, depthA, depthB):
+        """
+        Rows of defs that disappear when the scour grows from depthA to depthB (> depthA).
+        """
+        a = np.searchsorted(self.exposure, depthA, side="left")
+        b = np.searchsorted(self.exposure, depthB, side="left")
+        return np.sort(self.order[a:b])
+
+    def active(self, scourDepth):
+        return [self.defs[row] for row in self.active_rows(scourDepth)]
+
+    def exposed(self, depthA, depthB):
+        return [self.defs[row] for row in self.exposed_rows(depthA, depthB)]
+
+    def active_tags(self, scourDepth):
+        return set(self.tags[self.active_rows(scourDepth)].tolist())
+
+
+class ModelTables:
+    """
+    The bridge model as structured arrays, with vectorized lookups by tag.
+
+    Usage:
+        tables = load_model_tables()
+        xyz = tables.lookup('nodes', [5201, 3202])[['x', 'y', 'z']]
+        run_calls(tables.spring_calls(scourDepth=14050.0))
+    """
+
+    names = ('nodes', 'restraints', 'constraints', 'masses', 'elements', 'springs',
+             'node_loads', 'beam_loads')
+    tag_field = {'nodes': 'tag', 'restraints': 'tag', 'constraints': 'constrained',
+                 'masses': 'tag', 'elements': 'tag', 'springs': 'tag',
+                 'node_loads': 'tag', 'beam_loads': 'tag'}
+
+    def __init__(self, arrays):
+        for name in self.names:
+            setattr(self, name, arrays[name])
+        self._sorted = {}
+        self._calls = None
+        self.spring_index = SpringDepthIndex(self.springs, self.springs['exposure'],
+                                             self.springs['tag'])
+
+    # ── Lookups ──────────────────────────────────────────────────
+
+    def rows(self, name, tags):
+        """
+        Row indices of the given tags in table name (KeyError for unknown tags).
+        """
+        table = getattr(self, name)
+        if name not in self._sorted:
+            keys = table[self.tag_field[name]]
+            order = np.argsort(keys, kind="stable")
+            self._sorted[name] = (keys[order], order)
+        keys, order = self._sorted[name]
+        tags = np.atleast_1d(np.asarray(tags, dtype=np.int64))
+        pos = np.minimum(np.searchsorted(keys, tags), len(keys) - 1)
+        missing = keys[pos] != tags
+        if missing.any():
+            raise KeyError(f"{name}: unknown tags {tags[missing].tolist()}")
+        return order[pos]
+
+    def lookup(self, name, tags):
+        """
+        Records of table name for the given tags, in the order of tags.
+        """
+        return getattr(self, name)[self.rows(name, tags)]
+
+    def column_elements(self):
+        """
+        Tags of the fiber-section (nonlinearBeamColumn) column elements.
+        """
+        return [tag for tag, ele_type in zip(self.elements['tag'].tolist(), self.elements['type'])
+                if ele_type.decode() in integer_arg_elements]
+
+    # ── Bulk definition ──────────────────────────────────────────
+
+    def definition_calls(self):
+        """
+        Every OpenSees call of the tables as (command, args) pairs, in the order
+        of the literal modules (Node.py, Restraint.py, ...), grouped into
+        'structure' (nodes, fixities, constraints, masses), 'elements', 'springs'
+        (one per springs row) and 'loads'. The arrays are converted once per
+        ModelTables; run_calls() then replays a group without touching NumPy.
+        """
+        if self._calls is None:
+            structure = [(ops.node, row) for row in self.nodes.tolist()]
+            structure += [(ops.fix, (tag, *fix)) for tag, fix in
+                          zip(self.restraints['tag'].tolist(), self.restraints['fix'].tolist())]
+            structure += [(ops.equalDOF, (retained, constrained, *(np.flatnonzero(mask) + 1).tolist()))
+                          for retained, constrained, mask in zip(self.constraints['retained'].tolist(),
+                                                                 self.constraints['constrained'].tolist(),
+                                                                 self.constraints['dofs'])]
+            structure += [(ops.mass, (tag, *mass)) for tag, mass in
+                          zip(self.masses['tag'].tolist(), self.masses['mass'].tolist())]
+
+            elements = []
+            for ele_type, tag, i_node, j_node, nargs, args, transf in self.elements.tolist():
+                ele_type = ele_type.decode()
+                args = args[:nargs].tolist()
+                if ele_type in integer_arg_elements:
+                    args = [int(a) for a in args]
+                elements.append((ops.element, (ele_type, tag, i_node, j_node, *args, transf)))
+
+            springs = [(ops.element, ('zeroLength', tag, i_node, j_node,
+                                      '-mat', *mats[:nmat].tolist(), '-dir', *dirs[:nmat].tolist()))
+                       for tag, i_node, j_node, nmat, mats, dirs, _ in self.springs.tolist()]
+
+            # same gravity pattern as GravityLoad.defineLoads (time series 1, pattern 1)
+            loads = [(ops.timeSeries, ("Linear", 1)), (ops.pattern, ("Plain", 1, 1))]
+            loads += [(ops.load, (tag, *load)) for tag, load in
+                      zip(self.node_loads['tag'].tolist(), self.node_loads['load'].tolist())]
+            loads += [(ops.eleLoad, ("-ele", tag, "-type", "-beamUniform", wy, wz))
+                      for tag, wy, wz in self.beam_loads.tolist()]
+
+            self._calls = {'structure': structure, 'elements': elements,
+                           'springs': springs, 'loads': loads}
+        return self._calls
+
+    def spring_calls(self, scourDepth):
+        """
+        The 'springs' calls still present at scourDepth, the springs of
+        ZeroLengthElement.defineZeroLengthElement(scourDepth).
+        """
+        springs = self.definition_calls()['springs']
+        return [springs[row] for row in self.spring_index.active_rows(scourDepth).tolist()]
+
+
+def run_calls(calls):
+    """
+    Replays (command, args) pairs from ModelTables.definition_calls().
+    """
+    for command, args in calls:
+        command(*args)
+
+
+# ── Cache ────────────────────────────────────────────────────────
+
+def source_hash():
+    digest = hashlib.sha1()
+    for name in source_modules:
+        with open(os.path.join(here, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def fixed_zero_length_calls():
+    """
+    The literal ops.element('zeroLength', ...) calls of defineZeroLengthElement
+    (the springs that exist at every scour depth), as (tag, iNode, jNode, mats, dirs).
+    """
+    with open(os.path.join(here, 'ZeroLengthElement.py')) as f:
+        tree = ast.parse(f.read())
+    func = next(node for node in tree.body
+                if isinstance(node, ast.FunctionDef) and node.name == 'defineZeroLengthElement')
+    calls = []
+    for stmt in func.body:
+        call = getattr(stmt, 'value', None)
+        if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                and call.func.attr == 'element'):
+            continue
+        args = [ast.literal_eval(a) for a in call.args]
+        if args[0] != 'zeroLength':
+            continue
+        split = args.index('-dir')
+        calls.append((args[1], args[2], args[3], args[5:split], args[split + 1:]))
+    return calls
+
+
+def gravity_loads():
+    """
+    The nodal loads and the beam_uniform_loads list of GravityLoad.defineLoads.
+    """
+    with open(os.path.join(here, 'GravityLoad.py')) as f:
+        tree = ast.parse(f.read())
+    func = next(node for node in tree.body
+                if isinstance(node, ast.FunctionDef) and node.name == 'defineLoads')
+    node_loads, beam_loads = [], []
+    for stmt in func.body:
+        if isinstance(stmt, ast.Assign) and stmt.targets[0].id == 'beam_uniform_loads':
+            beam_loads = ast.literal_eval(stmt.value)
+        call = getattr(stmt, 'value', None)
+        if (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                and call.func.attr == 'load'):
+            node_loads.append([ast.literal_eval(a) for a in call.args])
+    return node_loads, beam_loads
+
+
+def tables_from_modules():
+    """
+    Converts the literal tuple lists into structured arrays.
+    """
+    from Node import nodes
+    from Restraint import restraints
+    from Constraint import constraints
+    from Mass import masses
+    from Element import elements
+    from ZeroLengthElement import zero_length_defs, spring_exposure
+
+    node_table = np.array([tuple(n) for n in nodes], dtype=node_dtype)
+
+    restraint_table = np.zeros(len(restraints), dtype=restraint_dtype)
+    restraint_table['tag'] = [r[0] for r in restraints]
+    restraint_table['fix'] = [r[1:] for r in restraints]
+
+    constraint_table = np.zeros(len(constraints), dtype=constraint_dtype)
+    for row, (retained, constrained, dofs) in enumerate(constraints):
+        constraint_table[row]['retained'] = retained
+        constraint_table[row]['constrained'] = constrained
+        constraint_table[row]['dofs'][np.asarray(dofs) - 1] = 1
+
+    mass_table = np.zeros(len(masses), dtype=mass_dtype)
+    mass_table['tag'] = [m[0] for m in masses]
+    mass_table['mass'] = [m[1:] for m in masses]
+
+    element_table = np.zeros(len(elements), dtype=element_dtype)
+    for row, (ele_type, tag, i_node, j_node, *args) in enumerate(elements):
+        args, transf = args[:-1], args[-1]
+        element_table[row]['type'] = ele_type
+        element_table[row]['tag'] = tag
+        element_table[row]['iNode'] = i_node
+        element_table[row]['jNode'] = j_node
+        element_table[row]['nargs'] = len(args)
+        element_table[row]['args'][:len(args)] = args
+        element_table[row]['transf'] = transf
+
+    # Fixed springs first, then zero_length_defs, as in defineZeroLengthElement
+    spring_defs = fixed_zero_length_calls() + list(zero_length_defs)
+    spring_table = np.zeros(len(spring_defs), dtype=spring_dtype)
+    for row, (tag, i_node, j_node, mats, dirs) in enumerate(spring_defs):
+        spring_table[row]['tag'] = tag
+        spring_table[row]['iNode'] = i_node
+        spring_table[row]['jNode'] = j_node
+        spring_table[row]['nmat'] = len(mats)
+        spring_table[row]['mats'][:len(mats)] = mats
+        spring_table[row]['dirs'][:len(dirs)] = dirs
+        spring_table[row]['exposure'] = spring_exposure(mats)
+
+    node_loads, beam_loads = gravity_loads()
+    node_load_table = np.zeros(len(node_loads), dtype=node_load_dtype)
+    node_load_table['tag'] = [n[0] for n in node_loads]
+    node_load_table['load'] = [n[1:] for n in node_loads]
+    beam_load_table = np.array([tuple(b) for b in beam_loads], dtype=beam_load_dtype)
+
+    return {'nodes': node_table, 'restraints': restraint_table,
+            'constraints': constraint_table, 'masses': mass_table,
+            'elements': element_table, 'springs': spring_table,
+            'node_loads': node_load_table, 'beam_loads': beam_load_table}
+
+
+def write_model_tables(path=MODEL_TABLES_PATH):
+    """
+    Writes the model tables to path (.npz) and returns them as a dict of arrays.
+    """
+    arrays = tables_from_modules()
+    tmp = f"{path}.{os.getpid()}.tmp.npz"
+    np.savez(tmp, source_hash=np.array(source_hash()), **arrays)
+    os.replace(tmp, path)  # atomic, so concurrent workers never see a partial file
+    return arrays
+
+
+_tables = {}  # loaded tables per path, shared by everything in this process
+
+
+def load_model_tables(path=MODEL_TABLES_PATH, rebuild=False):
+    """
+    ModelTables of the bridge, from the .npz cache at path; the cache is
+    (re)written from the literal modules if missing, stale or rebuild=True.
+    """
+    if path in _tables and not rebuild:
+        return _tables[path]
+    arrays = None
+    if not rebuild and os.path.exists(path):
+        with np.load(path, allow_pickle=False) as npz:
+            if str(npz['source_hash']) == source_hash():
+                arrays = {name: npz[name] for name in ModelTables.names}
+    if arrays is None:
+        arrays = write_model_tables(path)
+    _tables[path] = ModelTables(arrays)
+    return _tables[path]
@@ -6,31 +6,95 @@
 
 # model_setup.py
 import openseespy.opensees as ops
-from os_model_functions import *
-from Node import nodes
-from Restraint import restraints
-from Constraint import constraints
-from Mass import masses
 from GeoTrans import defineGeoTrans
 from SectionMat import defineSectionMaterials
 from ColSection import defineColSection
-from Element import define_elements
-from ZeroLengthElement import defineZeroLengthElement
-from GravityLoad import  defineLoads 
+from model_data import load_model_tables, run_calls
 
-def build_model(fc, fy, scourDepth=0):
+def build_model(fc, fy, scourDepth=0, tables=None):
+    # Nodes, fixities, constraints, masses, elements, springs and gravity loads come
+    # from the array-backed tables of model_data (cached copy of Node.py,
+    # Restraint.py, ...), or from tables of another variant (bridge_generator.py),
+    # as the calls prepared once per process by ModelTables.definition_calls().
+    # The row-by-row definition for debugging is os_model_functions.
+    if tables is None:
+        tables = load_model_tables()
     ops.wipe()
     ops.model('basic', '-ndm', 3, '-ndf', 6)
-    define_nodes(nodes)
-    apply_restraints(restraints)
-    apply_constraints(constraints)
-    apply_masses(masses)
+    calls = tables.definition_calls()
+    run_calls(calls['structure'])
     defineGeoTrans()
     defineSectionMaterials(fc, fy)  # ← Pass random fc and fy here
     defineColSection()
-    define_elements()
-    defineZeroLengthElement(scourDepth)
-    defineLoads()
+    run_calls(calls['elements'])
+    run_calls(tables.spring_calls(scourDepth))
+    print(f"Finished creating zero-length elements (scourDepth = {scourDepth}).")
+    run_calls(calls['loads'])
 
 
+class ModelTemplate:
+    """
+    Model built once per process and re-targeted per sample.
 
+    The scour-independent part (nodes, fixities, constraints, masses, elements,
+    sections and loads) is defined once with every soil spring present. apply()
+    then only
+      - reverts the domain to its initial state (op.reset) and drops the previous
+        sample's analysis, recorders and load patterns,
+      - updates fc / fy of the column fibers through OpenSees parameters
+        ('fc', 'fcu' of Concrete01 and 'Fy' of Steel02), and
+      - removes / re-adds the p-y and t-z springs exposed between the previous
+        and the requested scour depth (ModelTables.spring_index).
+    The resulting domain gives the same response as build_model(fc, fy, scourDepth).
+    """
+
+    # parameter tags used for the column material updates
+    param_fc, param_fcu, param_fy = 1, 2, 3
+    # Linear series of the gravity pattern (the 'loads' calls of ModelTables) and of the lateral pushover pattern
+    time_series_tags = (1, 2)
+
+    def __init__(self, fc=27.0, fy=420.0, tables=None):
+        self.tables = load_model_tables() if tables is None else tables
+        build_model(fc, fy, scourDepth=0, tables=self.tables)  # scourDepth=0 keeps every spring
+        self.scourDepth = 0
+        # fc and fy reach the fibers of the columns through OpenSees parameters
+        # instead of redefining the materials
+        columns = self.tables.column_elements()
+        for tag, name in ((self.param_fc, 'fc'), (self.param_fcu, 'fcu'), (self.param_fy, 'Fy')):
+            ops.parameter(tag, 'element', columns[0], name)
+            for ele in columns[1:]:
+                ops.addToParameter(tag, 'element', ele, name)
+        self.used = False
+
+    def apply(self, fc, fy, scourDepth=0):
+        """
+        Turns the template into build_model(fc, fy, scourDepth).
+        """
+        if self.used:
+            ops.wipeAnalysis()
+            ops.remove('recorders')
+            for pattern in ops.getPatterns():
+                ops.remove('loadPattern', pattern)
+            for ts in self.time_series_tags:
+                ops.remove('timeSeries', ts)
+            ops.reset()
+            run_calls(self.tables.definition_calls()['loads'])
+        self.used = True
+
+        # Materials (same conventions as defineSectionMaterials)
+        ops.updateParameter(self.param_fc, -abs(fc))
+        ops.updateParameter(self.param_fcu, -0.2 * abs(fc))
+        ops.updateParameter(self.param_fy, fy)
+
+        # Scour-dependent springs: only those between the old and new depth change
+        index = self.tables.spring_index
+        if scourDepth >= self.scourDepth:
+            for tag in index.tags[index.exposed_rows(self.scourDepth, scourDepth)].tolist():
+                ops.remove('element', tag)
+        else:
+            springs = self.tables.definition_calls()['springs']
+            run_calls(springs[row] for row in index.exposed_rows(scourDepth, self.scourDepth).tolist())
+        self.scourDepth = scourDepth
+
+        # Materials re-initialise with the new parameters
+        ops.reset()
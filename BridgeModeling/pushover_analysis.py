@@ -0,0 +1,615 @@
+# pushover_analysis.py
+# Single-sample pushover workflow of Pushover.ipynb (build -> gravity -> lateral
+# pushover with algorithm fallback), packaged as functions so that a sample can
+# run in any process that holds its own OpenSees domain.
+import os
+import numpy as np
+import openseespy.opensees as op
+from RecorderColFiber import (define_recorders, define_displacement_recorders, ResponseCapture,
+                              resample_response)
+from campaign_manifest import mark_sample
+from model_setup import build_model, ModelTemplate
+from solver_telemetry import SolverTelemetry, analyze
+from Parameters import solver_system, solver_numberer
+from Parameters import (push_dincr_init, push_dincr_min, push_dincr_max, push_iter_target,
+                        push_trial_iter, push_grow, push_shrink, push_cut, push_hold,
+                        push_softening, push_steady, push_yield_ratio, push_post_yield,
+                        push_post_yield_points)
+
+# === User-defined input parameters ===
+IDctrlNode = 5201
+LCol = 13050.0
+Weight = 28.703462  # MN
+
+DmaxRatio  = 0.05
+DincrRatio = 0.0001
+maxNumIter = 100
+tol        = 1.0e-6
+
+IDctrlDOF   = 2
+loadNodeTag = 5201
+patternTag  = 200
+load_vector = [0.0, Weight, 0.0, 0.0, 0.0, 0.0]
+
+# === Derived ===
+Dmax  = DmaxRatio * LCol
+Dincr = DincrRatio * LCol
+Nsteps = int(Dmax / Dincr)
+
+# === Fallback combinations tried when plain Newton fails ===
+test_dict = {
+    1: 'NormDispIncr',
+    2: 'RelativeEnergyIncr',
+    4: 'RelativeNormUnbalance',
+    5: 'RelativeNormDispIncr',
+    6: 'NormUnbalance'
+}
+algo_dict = {
+    1: 'KrylovNewton',
+    2: 'SecantNewton',
+    4: 'RaphsonNewton',
+    5: 'PeriodicNewton',
+    6: 'BFGS',
+    7: 'Broyden',
+    8: 'NewtonLineSearch'
+}
+
+# Per-process model template, created by the first run_sample(template=True)
+_model_template = None
+# (test, algorithm) pairs that solved a failing step in this process, most recent first
+_fallback_winners = []
+
+
+def prepare_model(fc, fy, scourDepthmm, template=False):
+    """
+    Defines the model of one sample, from scratch or by re-targeting the
+    per-process ModelTemplate (template=True).
+    """
+    global _model_template
+    if not template:
+        _model_template = None  # the wipe below discards it
+        op.wipe()
+        build_model(fc, fy, scourDepthmm)
+        return
+    if _model_template is None:
+        op.wipe()
+        _model_template = ModelTemplate(fc, fy)
+    _model_template.apply(fc, fy, scourDepthmm)
+
+
+def release_model(template=False):
+    """
+    Closes the sample's recorders; without a template the domain is wiped.
+    """
+    if template:
+        op.remove('recorders')
+    else:
+        op.wipe()
+
+
+def recorder_folder(label, scour_depth_mm, sample_id, out_root='RecorderData'):
+    """
+    Output folder of one sample: {out_root}/{label}/scour_{depth:.1f}_s{sample_id}.
+    The sample ID keeps samples of equal depth (e.g. capped at 20 m) apart.
+    """
+    depth = round(scour_depth_mm, 1)
+    return os.path.join(out_root, label, f"scour_{depth:.1f}_s{sample_id}")
+
+
+def analyze_once(telemetry=None, algorithm='Newton'):
+    """
+    op.analyze(1), logged as a step of telemetry (SolverTelemetry) when given.
+    """
+    return analyze(telemetry, IDctrlNode, IDctrlDOF, algorithm)
+
+
+def define_solver(solver=None):
+    """
+    op.numberer and op.system of an analysis.
+
+    Parameters:
+        solver (tuple or None): (system, numberer), e.g. ('UmfPack', 'RCM');
+                                None takes solver_system and solver_numberer
+                                of Parameters.py.
+    """
+    system, numberer = solver or (solver_system, solver_numberer)
+    op.numberer(numberer)
+    op.system(system)
+
+
+def run_gravity(telemetry=None, solver=None):
+    """
+    Runs the gravity step and holds the gravity loads constant.
+
+    Returns:
+        int: OpenSees analyze() flag (0 on success).
+    """
+    op.constraints("Transformation")
+    define_solver(solver)
+    op.algorithm("Newton")
+    op.test("NormDispIncr", 1.0e-6, 1000)
+    op.integrator("LoadControl", 1.0)
+    op.analysis("Static")
+
+    result = analyze_once(telemetry)
+    if result != 0:
+        return result
+    op.reactions()
+    op.loadConst("-time", 0.0)
+    return result
+
+
+def apply_lateral_load():
+    """
+    Defines the lateral load pattern at the control node.
+    """
+    op.timeSeries('Linear', 2)
+    op.pattern('Plain', patternTag, 2)
+    op.load(loadNodeTag, *load_vector)
+
+
+def restore_gravity(telemetry=None, solver=None):
+    """
+    Returns the domain to its state right after run_gravity(), e.g. to rerun the
+    pushover of the same (fc, fy, scour) sample without rebuilding the model.
+
+    The recorders, the lateral pattern and the analysis are removed, op.reset()
+    reverts nodes and elements to their initial state, and the gravity step runs
+    again. The gravity pattern is constant after loadConst, so the step lands on
+    the same state as the first run_gravity(), bit for bit, for the cost of one
+    gravity step. (Writing back the post-gravity nodal displacements instead does
+    not save its Newton iterations: the force-based columns iterate their element
+    state from the initial one either way.)
+
+    Returns:
+        int: OpenSees analyze() flag of the gravity step (0 on success).
+    """
+    op.wipeAnalysis()
+    op.remove('recorders')
+    op.remove('loadPattern', patternTag)
+    op.remove('timeSeries', 2)
+    op.reset()
+    return run_gravity(telemetry, solver)
+
+
+def setup_pushover_analysis(dincr=Dincr, solver=None):
+    """
+    Defines the displacement-controlled static analysis.
+    """
+    op.wipeAnalysis()
+    op.constraints('Transformation')
+    define_solver(solver)
+    op.test('EnergyIncr', tol, maxNumIter)
+    op.algorithm('Newton')
+    op.integrator('DisplacementControl', IDctrlNode, IDctrlDOF, dincr)
+    op.analysis('Static')
+
+
+def set_algorithm(algo_type):
+    """
+    op.algorithm(algo_type); the Krylov and secant Newton variants use the initial tangent.
+    """
+    if algo_type in ['KrylovNewton', 'SecantNewton']:
+        op.algorithm(algo_type, '-initial')
+    else:
+        op.algorithm(algo_type)
+
+
+def fallback_combinations():
+    """
+    (test, algorithm) pairs in the order the step fallback tries them: those that
+    solved a step in this process, most recent first, then test_dict x algo_dict.
+    Neighbouring samples of a worker tend to fail alike, so the last winner is
+    usually the first one tried.
+    """
+    combos = [(t, a) for t in test_dict.values() for a in algo_dict.values()]
+    return _fallback_winners + [c for c in combos if c not in _fallback_winners]
+
+
+def analyze_step(verbose=True, telemetry=None):
+    """
+    Advances the analysis by one step with plain Newton. If Newton fails, only
+    this step is retried with the fallback combinations (fallback_combinations),
+    and Newton with the 'EnergyIncr' test is restored for the next step.
+
+    Returns:
+        tuple: (ok, fallback) where ok is the analyze() flag of the step and
+               fallback the "test + algorithm" string that solved it, or None
+               if Newton was enough.
+    """
+    ok = analyze_once(telemetry)
+    if ok == 0:
+        return ok, None
+
+    for test_type, algo_type in fallback_combinations():
+        set_algorithm(algo_type)
+        op.test(test_type, tol, 1000)
+        ok = analyze_once(telemetry, f"{test_type} + {algo_type}")
+        if verbose:
+            print(f"Trying {test_type} + {algo_type} → Result: {ok}")
+        if ok == 0:
+            break
+    op.test('EnergyIncr', tol, maxNumIter)
+    op.algorithm('Newton')
+    if ok != 0:
+        return ok, None
+
+    combo = (test_type, algo_type)
+    if combo in _fallback_winners:
+        _fallback_winners.remove(combo)
+    _fallback_winners.insert(0, combo)
+    return ok, f"{test_type} + {algo_type}"
+
+
+def join_fallbacks(fallbacks):
+    """
+    The fallback combinations used in a run as one string ("; "-separated), or None.
+    """
+    return "; ".join(dict.fromkeys(fallbacks)) or None
+
+
+def run_pushover(nsteps=Nsteps, capture=None, verbose=True, telemetry=None):
+    """
+    Runs the pushover step by step; a step that plain Newton cannot solve goes
+    through the fallback of analyze_step, and the next step is Newton again.
+
+    Parameters:
+        nsteps (int): Number of displacement increments.
+        capture (ResponseCapture or None): If given, every converged step is
+                                           captured in memory.
+        verbose (bool): Print the result of each fallback attempt.
+        telemetry (SolverTelemetry or None): Records every analyze() attempt.
+
+    Returns:
+        tuple: (ok, fallback) where ok is the final analyze() flag and fallback is
+               the "test + algorithm" string of the combinations that solved a
+               step ("; "-separated), or None if plain Newton was enough.
+    """
+    ok, fallbacks = 0, []
+    for step in range(nsteps):
+        ok, fallback = analyze_step(verbose, telemetry)
+        if ok != 0:
+            if verbose:
+                print(f"Step {step + 1} of {nsteps} failed → Result: {ok}")
+            break
+        if capture is not None:
+            capture.record()
+        if fallback is not None:
+            fallbacks.append(fallback)
+    return ok, join_fallbacks(fallbacks)
+
+
+def run_adaptive_pushover(dmax=Nsteps * Dincr, capture=None, verbose=True, telemetry=None):
+    """
+    Runs the pushover with an adaptive displacement increment (see the pushover
+    parameters of Parameters.py, given as fractions of LCol).
+
+    The increment starts at push_dincr_init and stays within [push_dincr_min,
+    push_dincr_max]. It grows by push_grow after a step that converged within
+    push_iter_target / 2 iterations while the tangent stiffness held at least
+    push_steady of the previous step's, and is cut by push_shrink when a step
+    needs more than push_iter_target iterations or when the tangent stiffness
+    drops below push_softening of the previous step's (the knee of the curve).
+    Steps above push_dincr_min are trials capped at push_trial_iter Newton
+    iterations: a trial that would fail usually does so inside the fiber
+    elements a few iterations later, at the cost of dozens of converged steps,
+    so the cap turns it into a cheap failure. A failed trial cuts the increment
+    by push_cut, and for push_hold steps afterwards the increment stays below
+    the size that failed. Once the tangent stiffness falls below
+    push_yield_ratio of the initial one the pier has yielded, and the run stops
+    as soon as the drift reaches push_post_yield times the yield drift with
+    push_post_yield_points post-yield steps, which is enough for the bilinear
+    fit (by default the run goes on to dmax). A step that fails at the smallest
+    increment goes through the fallback of analyze_step (with the full
+    iteration limit), after which the controller carries on with Newton.
+
+    The steps are not uniform in drift; resample the response onto the Dincr
+    grid (RecorderColFiber.resample_response) before the bilinear fit, as
+    analyze_model does for captured responses.
+
+    Parameters:
+        dmax (float): Largest control-node displacement (mm); the last drift of
+                      the fixed-step pushover by default.
+        capture (ResponseCapture or None): Captures every converged step.
+        verbose (bool): Print the number of steps and the end of the run.
+        telemetry (SolverTelemetry or None): Records every analyze() attempt.
+
+    Returns:
+        tuple: (ok, fallback) as run_pushover.
+    """
+    dincr_min, dincr_max = push_dincr_min * LCol, push_dincr_max * LCol
+    dincr = push_dincr_init * LCol
+    d, lam = op.nodeDisp(IDctrlNode, IDctrlDOF), op.getTime()
+    k_init = k_prev = d_yield = None
+    n_steps = n_post = hold = 0
+    ceiling = dincr_max
+    fallbacks = []
+    integrator_dincr = None
+    op.test('EnergyIncr', tol, push_trial_iter)
+    while d < dmax - 0.5 * dincr_min:
+        dincr = min(dincr, dmax - d)
+        if dincr != integrator_dincr:
+            # Redefining the integrator re-initializes the analysis at nearly the
+            # cost of a converged step, so only a new increment does it
+            op.integrator('DisplacementControl', IDctrlNode, IDctrlDOF, dincr)
+            integrator_dincr = dincr
+        if dincr > dincr_min:
+            if analyze_once(telemetry) != 0:
+                ceiling, hold = dincr, push_hold
+                dincr = max(push_cut * dincr, dincr_min)
+                continue
+        else:
+            op.test('EnergyIncr', tol, maxNumIter)
+            ok, fallback = analyze_step(verbose, telemetry)
+            if ok != 0:
+                if verbose:
+                    print(f"Adaptive step failed at u = {d:.3f} after {n_steps} steps")
+                return ok, join_fallbacks(fallbacks)
+            op.test('EnergyIncr', tol, push_trial_iter)
+            if fallback is not None:
+                fallbacks.append(fallback)
+        if capture is not None:
+            capture.record()
+        n_steps += 1
+
+        # Tangent stiffness of the step (load factor per mm)
+        d_new, lam_new = op.nodeDisp(IDctrlNode, IDctrlDOF), op.getTime()
+        k = (lam_new - lam) / (d_new - d)
+        d, lam = d_new, lam_new
+        if k_init is None:
+            k_init = k
+        if d_yield is None and k < push_yield_ratio * k_init:
+            d_yield = d
+        if d_yield is not None:
+            n_post += 1
+            if (push_post_yield is not None and d >= push_post_yield * d_yield
+                    and n_post >= push_post_yield_points):
+                break
+
+        iters = op.testIter()
+        if iters > push_iter_target or (k_prev is not None and k < push_softening * k_prev):
+            dincr = max(push_shrink * dincr, dincr_min)
+        elif iters <= push_iter_target // 2 and (k_prev is None or k >= push_steady * k_prev):
+            dincr = max(min(push_grow * dincr, dincr_max if hold == 0 else push_shrink * ceiling),
+                        dincr)
+        k_prev = k
+        hold = max(hold - 1, 0)
+
+    op.test('EnergyIncr', tol, maxNumIter)
+    if verbose:
+        print(f"Adaptive pushover: {n_steps} steps, u = {d:.3f}")
+    return 0, join_fallbacks(fallbacks)
+
+
+def new_status(label, sample_id, scour_depth_mm, fc, fy, folder):
+    """
+    Status record of one sample before it runs.
+    """
+    return {
+        'scenario': label,
+        'sample': sample_id,
+        'scour_depth_mm': scour_depth_mm,
+        'fc': fc,
+        'fy': fy,
+        'folder': folder,
+        'status': 'failed',
+        'ok': None,
+        'fallback': None,
+        'disp': None,
+        'retried': False,
+    }
+
+
+def record_telemetry(status, telemetry):
+    """
+    Adds the solver summary fields and the 'steps' table of telemetry to status.
+    """
+    status.update(telemetry.summary())
+    status['steps'] = telemetry.steps()
+    return status
+
+
+def push_model(status, binary=False, capture=False, adaptive=False, verbose=True,
+               telemetry=None, solver=None):
+    """
+    Lateral load, recorders and pushover on the post-gravity domain.
+
+    Returns:
+        tuple: (ok, fallback, response_capture) with ok and fallback as
+               run_pushover and the ResponseCapture of the run (None unless capture).
+    """
+    # === 3. Lateral load ===
+    apply_lateral_load()
+
+    # === 4. Recorders ===
+    response_capture = None
+    if capture:
+        response_capture = ResponseCapture(Nsteps, ctrl_node=IDctrlNode, ctrl_dof=IDctrlDOF)
+    else:
+        define_recorders(folder=status['folder'], binary=binary)
+        define_displacement_recorders(folder=status['folder'], binary=binary)
+
+    # === 5. Analysis ===
+    with telemetry.phase('pushover'):
+        setup_pushover_analysis(solver=solver)
+        if adaptive:
+            ok, fallback = run_adaptive_pushover(capture=response_capture, verbose=verbose,
+                                                 telemetry=telemetry)
+        else:
+            ok, fallback = run_pushover(capture=response_capture, verbose=verbose,
+                                        telemetry=telemetry)
+    return ok, fallback, response_capture
+
+
+def analyze_model(status, binary=False, capture=False, adaptive=False, verbose=True,
+                  telemetry=None, solver=None, retry_pushover=False):
+    """
+    Gravity, lateral load, recorders and pushover on the model currently in the
+    domain; fills in status (see run_sample) and returns it. The solver record
+    goes to telemetry (a new SolverTelemetry if None). With retry_pushover, a failed
+    pushover is run once more from the restored post-gravity state
+    (restore_gravity) with the other stepping (fixed <-> adaptive). A captured
+    adaptive response is resampled onto the Dincr grid (resample_response).
+    """
+    if telemetry is None:
+        telemetry = SolverTelemetry()
+
+    # === 2. Gravity analysis ===
+    with telemetry.phase('gravity'):
+        gravity = run_gravity(telemetry, solver)
+    if gravity != 0:
+        if verbose:
+            print(f"❌ Gravity failed for {status['scenario']} sample {status['sample']+1}")
+        status['status'] = 'gravity_failed'
+        return record_telemetry(status, telemetry)
+
+    stepping = adaptive
+    ok, fallback, response_capture = push_model(status, binary, capture, stepping, verbose,
+                                                telemetry, solver)
+
+    # === 6. Retry from the post-gravity state with the other stepping ===
+    if ok != 0 and retry_pushover:
+        if verbose:
+            print(f"↩️ Retrying {status['scenario']} sample {status['sample']+1} with "
+                  f"{'fixed' if adaptive else 'adaptive'} steps")
+        with telemetry.phase('gravity'):
+            gravity = restore_gravity(telemetry, solver)
+        if gravity == 0:
+            status['retried'] = True
+            stepping = not adaptive
+            ok, fallback, response_capture = push_model(status, binary, capture, stepping,
+                                                        verbose, telemetry, solver)
+
+    status['ok'] = ok
+    status['fallback'] = fallback
+    status['status'] = 'done' if ok == 0 else 'failed'
+    status['disp'] = op.nodeDisp(IDctrlNode, IDctrlDOF)
+    if response_capture is not None:
+        status['response'] = response_capture.response()
+        if stepping:
+            # Uniform drift points, so the bilinear fit weighs the curve like a fixed-step run
+            status['response'] = resample_response(status['response'], Dincr)
+    if verbose:
+        print(f"✅ Final uy @ Node {IDctrlNode}: u = {status['disp']:.6f} m")
+    return record_telemetry(status, telemetry)
+
+
+def run_sample(label, sample_id, scour_depth_mm, fc, fy, out_root='RecorderData',
+               binary=False, capture=False, manifest=None, template=False, adaptive=False,
+               solver=None, retry_pushover=False, verbose=True):
+    """
+    Runs one (scenario, sample) pushover in the current process' OpenSees domain.
+
+    Parameters:
+        label (str): Scenario label, e.g. "Extreme".
+        sample_id (int): Row index of the sample within the scenario sheet.
+        scour_depth_mm (float): Scour depth in mm (as in the "Scour_Depth_mm" column).
+        fc (float): Concrete compressive strength (MPa).
+        fy (float): Steel yield strength (MPa).
+        out_root (str): Root of the recorder output tree.
+        binary (bool): Write the recorders with '-binary' (.bin) instead of text (.out).
+        capture (bool): Skip the recorder files and return the (d, V, M, theta)
+                        history in memory under 'response' (see ResponseCapture).
+        manifest (str or None): Path of a campaign manifest (see campaign_manifest.py);
+                                the sample is marked 'running' when it starts and
+                                with its final status and fallback when it ends.
+        template (bool): Re-target this process' ModelTemplate instead of
+                         rebuilding the model from scratch.
+        adaptive (bool): Run the pushover with an adaptive displacement increment
+                         (run_adaptive_pushover) instead of Nsteps fixed steps.
+                         A captured response is resampled onto the Dincr grid;
+                         recorder files keep the adaptive steps (resample them
+                         with RecorderColFiber.resample_response before a fit).
+        solver (tuple or None): (system, numberer) of the analyses; None takes
+                                the solver settings of Parameters.py.
+        retry_pushover (bool): If the pushover fails, run it once more from the
+                               restored post-gravity state (restore_gravity) with
+                               the other stepping, fixed instead of adaptive or
+                               the reverse.
+        verbose (bool): Print progress lines like Pushover.ipynb.
+
+    Returns:
+        dict: Per-sample status with keys scenario, sample, scour_depth_mm, fc, fy,
+              folder, status ('done', 'gravity_failed' or 'failed'), ok, fallback,
+              disp (final control-node displacement, or None) and retried
+              (whether the result comes from the retry_pushover run); the solver
+              summary of solver_telemetry.summary_fields (phase wall times in s,
+              converged and failed analyze() attempts, test iterations) and
+              'steps', the per-attempt table of solver_telemetry.step_dtype;
+              with capture also 'response', the dict of ResponseCapture.response().
+    """
+    folder = None if capture else recorder_folder(label, scour_depth_mm, sample_id, out_root)
+    status = new_status(label, sample_id, scour_depth_mm, fc, fy, folder)
+    if manifest:
+        mark_sample(manifest, label, sample_id, 'running')
+    if verbose:
+        print(f"\n🔄 {label} | Sample {sample_id+1}: Scour = {scour_depth_mm/1000.0:.3f} m | fc' = {fc:.2f} MPa | fy = {fy:.2f} MPa")
+
+    # === 1. Build model ===
+    telemetry = SolverTelemetry()
+    scourDepthmm = round(scour_depth_mm + LCol, 1)
+    with telemetry.phase('build'):
+        prepare_model(fc, fy, scourDepthmm, template)
+
+    analyze_model(status, binary=binary, capture=capture, adaptive=adaptive, verbose=verbose,
+                  telemetry=telemetry, solver=solver, retry_pushover=retry_pushover)
+
+    # Closes the recorder files of this sample before the worker moves on.
+    release_model(template)
+    if manifest:
+        mark_sample(manifest, label, sample_id, status['status'], status['fallback'])
+    return status
+
+
+def scour_depth_grid(max_scour_depth_mm, increment_mm=250.0):
+    """
+    Scour depths 0, increment, 2*increment, ... up to max_scour_depth_mm (mm);
+    the default increment is scour_increment_m = 0.25 of parameters.py.
+    """
+    return [float(d) for d in np.arange(0.0, max_scour_depth_mm + 0.5 * increment_mm, increment_mm)]
+
+
+def run_scour_sweep(label, fc, fy, scour_depths_mm, out_root='RecorderData',
+                    binary=False, capture=False, adaptive=False, solver=None,
+                    retry_pushover=False, verbose=True):
+    """
+    Deterministic scour sweep on a single model.
+
+    The model is built once; the depths are then walked in increasing order, and
+    at each step only the springs exposed since the previous depth are removed
+    (ops.remove('element', ...)) before the domain is reverted to its initial
+    state and gravity and the pushover are run again.
+
+    Parameters:
+        label (str): Label of the sweep; output goes to {out_root}/{label}/scour_*_s{step}.
+        fc (float): Concrete compressive strength (MPa).
+        fy (float): Steel yield strength (MPa).
+        scour_depths_mm (iterable): Scour depths in mm, e.g. from scour_depth_grid().
+        out_root, binary, capture, adaptive, solver, retry_pushover, verbose:
+            As in run_sample.
+
+    Returns:
+        list: One status dict per depth (see run_sample), in increasing depth order.
+    """
+    global _model_template
+    _model_template = None  # the sweep owns the domain
+    op.wipe()
+    sweep = ModelTemplate(fc, fy)
+
+    statuses = []
+    for i, scour_depth_mm in enumerate(sorted(scour_depths_mm)):
+        folder = None if capture else recorder_folder(label, scour_depth_mm, i, out_root)
+        status = new_status(label, i, scour_depth_mm, fc, fy, folder)
+        if verbose:
+            print(f"\n🔄 {label} | Step {i+1}: Scour = {scour_depth_mm/1000.0:.3f} m")
+
+        telemetry = SolverTelemetry()
+        with telemetry.phase('build'):
+            sweep.apply(fc, fy, round(scour_depth_mm + LCol, 1))
+        statuses.append(analyze_model(status, binary=binary, capture=capture, adaptive=adaptive,
+                                      verbose=verbose, telemetry=telemetry, solver=solver,
+                                      retry_pushover=retry_pushover))
+        op.remove('recorders')
+
+    op.wipe()
+    return statuses
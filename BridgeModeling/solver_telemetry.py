@@ -0,0 +1,106 @@
+# solver_telemetry.py
+# Per-sample record of the OpenSees solver: wall time of the build, gravity and
+# pushover phases, and one row per op.analyze(1) attempt with its test
+# iterations, final test norm and the algorithm that ran it. The summary fields
+# go into the campaign results next to status and fallback, the step rows into
+# the /{scenario}/steps table of the campaign store.
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import openseespy.opensees as op
+
+phases = ('build', 'gravity', 'pushover')
+
+step_dtype = np.dtype([
+    ('phase', 'S8'),
+    ('algorithm', 'S48'),     # 'Newton' or the "test + algorithm" fallback
+    ('ok', np.int8),          # analyze() flag of the attempt
+    ('iterations', np.int32), # op.testIter()
+    ('norm', np.float64),     # last entry of op.testNorm()
+    ('disp', np.float64),     # control-node displacement after the attempt
+    ('wall_s', np.float64),
+])
+
+# Scalar fields of SolverTelemetry.summary()
+summary_fields = ('build_s', 'gravity_s', 'pushover_s', 'n_steps', 'n_failed',
+                  'iterations', 'max_iterations')
+
+
+class SolverTelemetry:
+    """
+    Solver record of one sample.
+
+    Usage:
+        telemetry = SolverTelemetry()
+        with telemetry.phase('gravity'):
+            ok = telemetry.analyze(disp_node=5201, disp_dof=2)
+        status.update(telemetry.summary())
+        steps = telemetry.steps()
+    """
+
+    def __init__(self):
+        self.times = dict.fromkeys(phases, 0.0)
+        self.current = ''
+        self.rows = []
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Adds the wall time of the block to phase name; steps inside it are tagged name.
+        """
+        previous, self.current = self.current, name
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.times[name] += time.perf_counter() - start
+            self.current = previous
+
+    def analyze(self, disp_node, disp_dof, algorithm='Newton'):
+        """
+        op.analyze(1), recorded as one step row.
+
+        Returns:
+            int: OpenSees analyze() flag.
+        """
+        start = time.perf_counter()
+        ok = op.analyze(1)
+        wall = time.perf_counter() - start
+        iterations = op.testIter()
+        norms = op.testNorm()
+        norm = norms[iterations - 1] if 0 < iterations <= len(norms) else np.nan
+        self.rows.append((self.current, algorithm, ok, iterations, norm,
+                          op.nodeDisp(disp_node, disp_dof), wall))
+        return ok
+
+    def steps(self):
+        """
+        The recorded attempts as a structured array of step_dtype.
+        """
+        return np.array(self.rows, dtype=step_dtype)
+
+    def summary(self):
+        """
+        Phase wall times (s), converged pushover steps, failed attempts (any
+        phase), and the total and largest number of test iterations of an attempt.
+        """
+        steps = self.steps()
+        return {
+            'build_s': self.times['build'],
+            'gravity_s': self.times['gravity'],
+            'pushover_s': self.times['pushover'],
+            'n_steps': int(((steps['phase'] == b'pushover') & (steps['ok'] == 0)).sum()),
+            'n_failed': int((steps['ok'] != 0).sum()),
+            'iterations': int(steps['iterations'].sum()),
+            'max_iterations': int(steps['iterations'].max()) if len(steps) else 0,
+        }
+
+
+def analyze(telemetry, disp_node, disp_dof, algorithm='Newton'):
+    """
+    op.analyze(1) through telemetry.analyze(), or directly when telemetry is None.
+    """
+    if telemetry is None:
+        return op.analyze(1)
+    return telemetry.analyze(disp_node, disp_dof, algorithm)
@@ -33,6 +33,203 @@ def fit_bilinear_profile(d, f, num_grid=200):
     fy = k1 * dy
     return k1, k2, dy, fy
 
+# ── Prefix-sum formulation ───────────────────────────────────────
+# With d sorted, a breakpoint dy that leaves the first m points in branch 1
+# only needs the sums Σd, Σf, Σd², Σdf, Σf² of the head (first m points) and
+# the moments of the tail (the rest). Cumulative sums give these for every m
+# at once, so k1, k2 and J of every candidate dy come out of one vectorized pass.
+# The tail moments are accumulated from the end of the curve about its last
+# point (d_end, f_end) and shifted to dy, not taken as total - head: expanding
+# Σ(d - dy)² from raw sums cancels to rounding noise when the tail is short.
+
+# a tail whose Σ(d - dy)² or d spread is below this fraction of its Σd² is singular
+TAIL_RTOL = 16 * np.finfo(float).eps
+
+def prefix_sums(d, f):
+    # cumulative [Σd, Σf, Σd², Σdf, Σf²] along the last axis of d, f;
+    # row m holds the sums over the first m points (row 0 is zero)
+    terms = np.stack([d, f, d * d, d * f, f * f], axis=-1)
+    P = np.cumsum(terms, axis=-2)
+    pad = np.zeros(P.shape[:-2] + (1, 5))
+    return np.concatenate([pad, P], axis=-2)
+
+def suffix_sums(u, v):
+    # reverse-cumulative [Σu, Σv, Σu², Σuv, Σv²] along the last axis of u, v
+    # (d, f relative to the last point); row m holds the sums over the points
+    # from m on (the last row is zero)
+    terms = np.stack([u, v, u * u, u * v, v * v], axis=-1)
+    S = np.flip(np.cumsum(np.flip(terms, axis=-2), axis=-2), axis=-2)
+    pad = np.zeros(S.shape[:-2] + (1, 5))
+    return np.concatenate([S, pad], axis=-2)
+
+def split_objective(head, tail, m, n, dy, d_end, f_end):
+    # k1, k2 and J for breakpoints dy whose first branch holds the first m of n points;
+    # head (prefix_sums row), tail (suffix_sums row) and d_end, f_end (the point the
+    # tail moments are taken about) broadcast against m, n, dy
+    n2 = n - m
+    Sdd, Sdf, Sff = head[..., 2], head[..., 3], head[..., 4]
+    Su, Sv, Suu, Suv, Svv = (tail[..., i] for i in range(5))
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # k1 >= 0 (0 when the first branch sits at d = 0, like max(0, nan) in profile_fit)
+        k1 = np.where(Sdd > 0, np.maximum(Sdf / Sdd, 0), 0.0)
+        # tail moments of w = d - dy and h = f - k1 dy, with w = u + e, h = v + q
+        e = d_end - dy
+        q = f_end - k1 * dy
+        Sww = Suu + 2 * e * Su + n2 * e**2
+        Swh = Suv + q * Su + e * Sv + n2 * e * q
+        Shh = Svv + 2 * q * Sv + n2 * q**2
+        # k2 from Σ(d - dy)(f - k1 dy) / Σ(d - dy)²
+        k2 = Swh / Sww
+        # J = Σ(f - k1 d)² over the head + Σ(f - k1 dy - k2 (d - dy))² over the tail
+        J1 = Sff - 2 * k1 * Sdf + k1**2 * Sdd
+        J2 = Shh - k2 * Swh
+        # k2 needs a Σ(d - dy)² above rounding noise and a tail of at least two
+        # distinct d (a one-point or all-tied tail fits any slope through the hinge)
+        Tdd = Suu + 2 * d_end * Su + n2 * d_end**2
+        spread = n2 * Suu - Su**2
+        ok = (m > 0) & (n2 >= 2) & (Sww > TAIL_RTOL * Tdd) & (spread > TAIL_RTOL * n2 * Tdd)
+        J = np.where(ok, np.maximum(J1, 0) + np.maximum(J2, 0), np.inf)
+    return k1, k2, J
+
+def segment_breakpoint(head, tail, m, n, lo, hi, d_end, f_end, dy0):
+    # exact best dy in (lo, hi] for a fixed head of m points. For fixed k1 the
+    # tail model f = k2 d + (k1 - k2) dy is a straight line with slope s = k2
+    # and intercept c = (k1 - k2) dy, so the unconstrained optimum is the tail
+    # OLS line: dy* = c / (k1 - s). J(dy) has no other local minimum, so the
+    # best dy in the segment is dy* (if inside) or one of its ends; the grid
+    # point dy0 stays a candidate, so the result never scores worse than it.
+    n2 = n - m
+    Su, Sv, Suu, Suv = tail[..., 0], tail[..., 1], tail[..., 2], tail[..., 3]
+    k1, _, _ = split_objective(head, tail, m, n, lo, d_end, f_end)
+    lo = np.nextafter(lo, np.inf)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # tail line v = s u + c in coordinates about (d_end, f_end)
+        s = (n2 * Suv - Su * Sv) / (n2 * Suu - Su**2)
+        c = (Sv - s * Su) / n2
+        dy_star = np.clip((f_end + c - s * d_end) / (k1 - s), lo, hi)
+    dy_star = np.where(np.isfinite(dy_star), dy_star, hi)
+    cand = np.stack(np.broadcast_arrays(dy_star, lo, hi, dy0), axis=-1)
+    _, _, J = split_objective(head[..., None, :], tail[..., None, :],
+                              np.asarray(m)[..., None], np.asarray(n)[..., None], cand,
+                              np.asarray(d_end)[..., None], np.asarray(f_end)[..., None])
+    best = np.argmin(J, axis=-1)
+    return np.take_along_axis(cand, best[..., None], axis=-1)[..., 0]
+
+def profile_fit_vectorized(d, f, dy_grid, refine=True):
+    # same search as profile_fit, scored from prefix sums in one pass;
+    # refine=True moves dy to the exact optimum inside the best grid segment
+    order = np.argsort(d, kind="stable")
+    d_s, f_s = d[order], f[order]
+    n = len(d_s)
+    d_end, f_end = d_s[-1], f_s[-1]
+    P = prefix_sums(d_s, f_s)
+    S = suffix_sums(d_s - d_end, f_s - f_end)
+    m = np.searchsorted(d_s, dy_grid, side="left")  # number of points with d < dy
+    _, _, J = split_objective(P[m], S[m], m, n, dy_grid, d_end, f_end)
+    i = np.argmin(J)
+    if not np.isfinite(J[i]):
+        return (None, None, None)
+    dy, mi = dy_grid[i], m[i]
+    if refine:
+        dy = segment_breakpoint(P[mi], S[mi], mi, n, d_s[mi - 1], d_s[mi], d_end, f_end, dy)
+    k1, k2, _ = split_objective(P[mi], S[mi], mi, n, dy, d_end, f_end)
+    return float(k1), float(k2), float(dy)
+
+def fit_bilinear_profile_fast(d, f, num_grid=200, refine=True):
+    d = np.asarray(d, dtype=float)
+    f = np.asarray(f, dtype=float)
+    if len(d) < 2:
+        raise ValueError(f"a bilinear fit needs at least two points, got {len(d)}")
+    if not (np.isfinite(d).all() and np.isfinite(f).all()):
+        raise ValueError("a bilinear fit needs finite d and f")
+    dy_min, dy_max = d.min(), d.max()
+    dy_grid = np.linspace(dy_min + 1e-6, dy_max - 1e-6, num_grid)
+    k1, k2, dy = profile_fit_vectorized(d, f, dy_grid, refine=refine)
+    if k1 is None:
+        raise ValueError("no breakpoint leaves a first branch and a second branch of two points")
+    fy = k1 * dy
+    return k1, k2, dy, fy
+
+# ── Batched fitting over many curves ─────────────────────────────
+
+def pad_curves(curves):
+    # ragged (d, f) curves -> padded (C, L) arrays sorted by d per row;
+    # padding is d = +inf, f = 0 so it never enters a head and adds 0 to prefix sums
+    d_list = [np.asarray(d, dtype=float).ravel() for d, _ in curves]
+    f_list = [np.asarray(f, dtype=float).ravel() for _, f in curves]
+    n = np.array([len(d) for d in d_list], dtype=int)
+    C, L = len(n), max(int(n.max()), 1)
+    offsets = np.concatenate([[0], np.cumsum(n)[:-1]])
+    rows = np.repeat(np.arange(C), n)
+    cols = np.arange(n.sum()) - np.repeat(offsets, n)
+    D = np.full((C, L), np.inf)
+    F = np.zeros((C, L))
+    D[rows, cols] = np.concatenate(d_list)
+    F[rows, cols] = np.concatenate(f_list)
+    order = np.argsort(D, axis=1, kind="stable")
+    return np.take_along_axis(D, order, axis=1), np.take_along_axis(F, order, axis=1), n
+
+def searchsorted_rows(D, n, x):
+    # row-wise np.searchsorted(D[c, :n[c]], x[c], side="left") as a vectorized bisection
+    rows = np.arange(D.shape[0])[:, None]
+    lo = np.zeros(x.shape, dtype=int)
+    hi = np.broadcast_to(n[:, None], x.shape).copy()
+    while np.any(lo < hi):
+        active = lo < hi
+        mid = (lo + hi) // 2
+        less = D[rows, np.minimum(mid, D.shape[1] - 1)] < x
+        lo = np.where(active & less, mid + 1, lo)
+        hi = np.where(active & ~less, mid, hi)
+    return lo
+
+def fit_bilinear_profile_batch(curves, num_grid=200, refine=True, chunk_size=2048):
+    # fit_bilinear_profile_fast over a ragged collection of (d, f) curves;
+    # returns arrays k1, k2, dy, Vy (NaN for curves that cannot be fitted,
+    # where fit_bilinear_profile_fast raises ValueError)
+    curves = list(curves)
+    out = np.full((4, len(curves)), np.nan)
+    # curves with fewer than two points, or with NaN / inf, have no fit and stay NaN
+    fit_idx = np.array([i for i, (d, f) in enumerate(curves)
+                        if np.size(d) >= 2 and np.isfinite(d).all() and np.isfinite(f).all()],
+                       dtype=int)
+    for start in range(0, len(fit_idx), chunk_size):
+        idx = fit_idx[start:start + chunk_size]
+        chunk = [curves[i] for i in idx]
+        D, F, n = pad_curves(chunk)
+        C = len(n)
+        rows = np.arange(C)
+        last = np.maximum(n - 1, 0)
+        pad = ~np.isfinite(D)
+        d_end, f_end = D[rows, last], F[rows, last]
+        P = prefix_sums(np.where(pad, 0.0, D), F)  # (C, L+1, 5)
+        S = suffix_sums(np.where(pad, 0.0, D - d_end[:, None]),
+                        np.where(pad, 0.0, F - f_end[:, None]))
+
+        # same dy grid per curve as fit_bilinear_profile
+        dy_grid = np.linspace(D[:, 0] + 1e-6, D[rows, last] - 1e-6, num_grid, axis=1)
+        m = searchsorted_rows(D, n, dy_grid)
+        head = np.take_along_axis(P, m[..., None], axis=1)
+        tail = np.take_along_axis(S, m[..., None], axis=1)
+        _, _, J = split_objective(head, tail, m, n[:, None], dy_grid,
+                                  d_end[:, None], f_end[:, None])
+
+        i = np.argmin(J, axis=1)
+        valid = np.isfinite(J[rows, i])
+        dy = dy_grid[rows, i]
+        mi = np.where(valid, m[rows, i], 1)
+        head, tail = P[rows, mi], S[rows, mi]
+        if refine:
+            lo = D[rows, mi - 1]
+            hi = D[rows, np.minimum(mi, D.shape[1] - 1)]
+            dy = np.where(valid, segment_breakpoint(head, tail, mi, n, lo, hi,
+                                                    d_end, f_end, dy), dy)
+        k1, k2, _ = split_objective(head, tail, mi, n, dy, d_end, f_end)
+
+        fit = np.stack([k1, k2, dy, k1 * dy])
+        out[:, idx] = np.where(valid, fit, np.nan)
+    k1, k2, dy, Vy = out
+    return k1, k2, dy, Vy
+
 if __name__ == "__main__":
     # Hardcoded input file and settings
     excel_file = "Pushover_Colorado.xlsx"
@@ -8,7 +8,7 @@
 span_length_m = 35
 deck_width_m = 12
 num_spans = 4
-column_height_m = 8.0  # assumed or to be updated
+column_height_m = 8.7  # clear column height (3x01 -> 3x02) of BridgeModeling
 
 # 2. Material Properties
 fc_mean = 27.0  # MPa
@@ -1,8 +1,60 @@
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
-from scipy.stats import norm, lognorm
+from scipy.spatial import cKDTree
+from scipy.special import ndtr, ndtri
+from scipy.stats import norm, lognorm, qmc
 
-def LHS_scour_hazard(lhsN, vel=10, dPier=2, gama=1e-6, zDot=8, Rey=None):
+from parameters import fc_mean, fc_std, fy_mean, fy_std
+
+z50_cap_m = 20.0  # the piers of the model are at most 20 m, so z50Final is capped there
+
+
+def hazard_rng(rng=None):
+    """
+    numpy Generator of a sampler call: a Generator is used as is, an int seed or
+    a SeedSequence seeds a new one, and None seeds one from the global
+    np.random state (so np.random.seed() still makes a script repeatable).
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng
+    if rng is None:
+        rng = np.random.randint(0, 2**63 - 1, dtype=np.int64)
+    return np.random.default_rng(rng)
+
+
+def hazard_seed_sequence(seed=None):
+    """
+    SeedSequence of seed (an int, a SeedSequence, or None for one drawn from the
+    global np.random state).
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if seed is None:
+        seed = int(np.random.randint(0, 2**63 - 1, dtype=np.int64))
+    return np.random.SeedSequence(seed)
+
+
+def spawn_rngs(seed, n):
+    """
+    n independent Generators from SeedSequence(seed).spawn(n), e.g. one per
+    scenario, batch or worker process. The same int seed gives the same streams
+    on every machine and in every process; note that spawning twice from one
+    SeedSequence object gives new children each time.
+    """
+    return [np.random.default_rng(child) for child in hazard_seed_sequence(seed).spawn(n)]
+
+
+def chunk_seed(seed_seq, k):
+    """
+    Child k of seed_seq, as seed_seq.spawn() would give it, built without spawning
+    the children before it.
+    """
+    return np.random.SeedSequence(seed_seq.entropy, spawn_key=seed_seq.spawn_key + (k,),
+                                  pool_size=seed_seq.pool_size)
+
+def LHS_scour_hazard(lhsN, vel=10, dPier=2, gama=1e-6, zDot=8, Rey=None, rng=None,
+                     sampling='lhs', start=0):
     """
     Computes the final scour depth (z50Final) using Latin Hypercube Sampling.
     
@@ -13,6 +65,12 @@ def LHS_scour_hazard(lhsN, vel=10, dPier=2, gama=1e-6, zDot=8, Rey=None):
         gama (float): Water viscosity. Default is 1e-6.
         zDot (float): Initial rate of scour (N/mm). Default is 8.
         Rey (float or None): Reynolds number. If None, computed as (vel * dPier / gama).
+        rng (Generator, int, SeedSequence or None): Random stream (see hazard_rng);
+            use spawn_rngs() for independent streams per scenario or worker.
+        sampling (str): 'lhs' (Latin Hypercube), or 'sobol' / 'halton' for the
+            scrambled quasi-Monte Carlo points of QMC_design.
+        start (int): With 'sobol' / 'halton', index of the first point, so that
+            a sample set drawn with the same int seed can be extended.
         
     Returns:
         results (dict): A dictionary containing computed variables including:
@@ -21,6 +79,7 @@ def LHS_scour_hazard(lhsN, vel=10, dPier=2, gama=1e-6, zDot=8, Rey=None):
             - zP: Lognormal CDF values evaluated at sorted scour depths
             - z50Mean, z50std: Mean and standard deviation of z50Final
             - z50LogMean, z50LogStd: Mean and std of the log-transformed z50Final
+            - summary: ScourHazardSummary of z50Final, for combine_simulated_samples
             - z50: Intermediate scour depth (in mm) before unit conversion
             - taoMax: Maximum hydraulic shear stress
             - zMax: Maximum scour depth (in mm)
@@ -44,16 +103,21 @@ def LHS_scour_hazard(lhsN, vel=10, dPier=2, gama=1e-6, zDot=8, Rey=None):
 
     # Latin Hypercube Sampling:
     # Create a series of probabilities partitioning the unit interval into lhsN segments.
-    randp = (np.arange(lhsN) / lhsN) + (np.random.rand(lhsN) / lhsN)
-    # Inverse CDF of the standard normal distribution (ppf)
-    lhs_err_ = norm.ppf(randp, loc=0, scale=1)
-    # Random permutation to further randomize the sample order
-    lhs_err = np.random.permutation(lhs_err_)
+    if sampling == 'lhs':
+        rng = hazard_rng(rng)
+        randp = (np.arange(lhsN) / lhsN) + (rng.random(lhsN) / lhsN)
+        # Inverse CDF of the standard normal distribution (ppf)
+        lhs_err_ = norm.ppf(randp, loc=0, scale=1)
+        # Random permutation to further randomize the sample order
+        lhs_err = rng.permutation(lhs_err_)
+    else:
+        # Quasi-Monte Carlo points are already spread evenly and in sequence order
+        lhs_err = ndtri(QMC_design(lhsN, 1, sampling, rng, start)[:, 0])
 
     # Compute the final scour depth assuming a lognormal distribution.
     # The division by 1000 converts the unit from mm to m.
     z50Final = (np.exp(-0.085) * z50 * np.exp(0.407 * lhs_err)) / 1000
-    z50Final = np.clip(z50Final, None, 20.0)  # meters - my the piers of my model are max 20m thats why i caped the z50final to 20m
+    z50Final = np.clip(z50Final, None, z50_cap_m)  # meters - my the piers of my model are max 20m thats why i caped the z50final to 20m
 
     # Statistical parameters
     z50Mean = np.mean(z50Final)
@@ -76,6 +140,7 @@ def LHS_scour_hazard(lhsN, vel=10, dPier=2, gama=1e-6, zDot=8, Rey=None):
         'z50std': z50std,
         'z50LogMean': z50LogMean,
         'z50LogStd': z50LogStd,
+        'summary': ScourHazardSummary().update(z50Final),
         #'z50': z50,
         #'taoMax': taoMax,
         #'zMax': zMax
@@ -84,45 +149,489 @@ def LHS_scour_hazard(lhsN, vel=10, dPier=2, gama=1e-6, zDot=8, Rey=None):
     return results
 
 
-def combine_simulated_samples(simulation_results):
+def scour_depth_z50(vel=10, dPier=2, gama=1e-6, zDot=8, Rey=None):
+    """
+    Scour depth at 50 years (mm) of LHS_scour_hazard before the error term;
+    works elementwise on arrays.
+    """
+    if Rey is None:
+        Rey = vel * dPier / gama
+    zMax = 0.18 * (Rey**0.635)
+    tYear = 50
+    tEq = 73 * (tYear**0.126) * (vel**1.706) * (zDot**-0.2)
+    return tEq / (1/zDot + tEq/zMax)
+
+
+def z50_final(z50, lhs_err):
+    """
+    Final scour depth (m, capped at z50_cap_m) of the scour depth z50 (mm) and
+    standard normal error samples lhs_err, as in LHS_scour_hazard.
+    """
+    return np.minimum((np.exp(-0.085) * z50 * np.exp(0.407 * lhs_err)) / 1000, z50_cap_m)
+
+
+def LHS_scour_hazard_batch(lhsN, vel=10, dPier=2, gama=1e-6, zDot=8, Rey=None, rng=None):
+    """
+    LHS_scour_hazard for many scenarios at once: the scenario parameters are
+    broadcast against each other, and every scenario gets its own lhsN Latin
+    Hypercube Samples of the error term, all in one NumPy pass.
+
+    Parameters:
+        lhsN (int): Number of Latin Hypercube Samples per scenario.
+        vel, dPier, gama, zDot (float or array): Scenario parameters as in
+            LHS_scour_hazard; arrays are broadcast to a common shape (S,).
+        Rey (float, array or None): Reynolds number; if None, vel * dPier / gama.
+        rng (Generator, int, SeedSequence or None): Random stream (see hazard_rng).
+
+    Returns:
+        results (dict): The keys of LHS_scour_hazard, with
+            - z50Final, z50Final_sort, zP: (S, lhsN) arrays, one row per scenario
+            - z50Mean, z50std, z50LogMean, z50LogStd: (S,) arrays
+            - vel, dPier, gama, zDot: the broadcast (S,) scenario parameters
+    """
+    params = [vel, dPier, gama, zDot] + ([] if Rey is None else [Rey])
+    params = np.broadcast_arrays(*(np.atleast_1d(np.asarray(p, dtype=float)) for p in params))
+    vel, dPier, gama, zDot = params[:4]
+    Rey = None if Rey is None else params[4]
+    nScen = vel.size
+    z50 = scour_depth_z50(vel, dPier, gama, zDot, Rey)
+
+    # Latin Hypercube Sampling: one stratified row per scenario, each row in its
+    # own random order. ndtri / ndtr are the ufuncs behind norm.ppf / norm.cdf
+    # without their argument handling.
+    rng = hazard_rng(rng)
+    randp = (np.arange(lhsN) / lhsN) + (rng.random((nScen, lhsN)) / lhsN)
+    lhs_err = rng.permuted(ndtri(randp), axis=1)
+
+    z50Final = z50_final(z50.reshape(-1, 1), lhs_err)
+
+    # Statistical parameters per scenario
+    logZ = np.log(z50Final)
+    z50LogMean = logZ.mean(axis=1)
+    z50LogStd = logZ.std(axis=1)
+
+    # Hazard curve: lognormal CDF at the sorted depths
+    z50Final_sort = np.sort(z50Final, axis=1)
+    zP = ndtr((np.log(z50Final_sort) - z50LogMean[:, None]) / z50LogStd[:, None])
+
+    return {
+        'z50Final': z50Final,
+        'z50Final_sort': z50Final_sort,
+        'zP': zP,
+        'z50Mean': z50Final.mean(axis=1),
+        'z50std': z50Final.std(axis=1),
+        'z50LogMean': z50LogMean,
+        'z50LogStd': z50LogStd,
+        'vel': vel.ravel(),
+        'dPier': dPier.ravel(),
+        'gama': gama.ravel(),
+        'zDot': zDot.ravel(),
+    }
+
+
+class ScourHazardSummary:
+    """
+    Online summary of z50Final samples with bounded memory: sample count,
+    Welford mean / sum of squared deviations of z50Final and of log(z50Final),
+    and a log-bucketed histogram (quantile sketch) for the hazard curve.
+
+    Chunks are folded in with update(), and two summaries of disjoint sample
+    sets combine with merge() (Chan et al. pairwise update), so the result does
+    not depend on how the samples were split. A histogram bucket spans a factor
+    gamma = (1 + rel_acc) / (1 - rel_acc), so a quantile read from the sketch is
+    within rel_acc of a sample value at that rank; depths below z_min share the
+    first bucket.
+
+    Usage:
+        summary = ScourHazardSummary()
+        for chunk in LHS_scour_hazard_stream(10**8, vel=6.5, dPier=1, zDot=500):
+            summary.update(chunk)
+        results = summary.results()
+    """
+
+    def __init__(self, rel_acc=0.005, z_min=1e-3, z_max=z50_cap_m):
+        self.rel_acc, self.z_min, self.z_max = rel_acc, z_min, z_max
+        self.log_gamma = np.log((1 + rel_acc) / (1 - rel_acc))
+        self.k_min = int(np.floor(np.log(z_min) / self.log_gamma))
+        k_max = int(np.ceil(np.log(z_max) / self.log_gamma))
+        self.counts = np.zeros(k_max - self.k_min + 1, dtype=np.int64)
+        self.n = 0
+        self.mean = self.m2 = 0.0          # z50Final
+        self.log_mean = self.log_m2 = 0.0  # log(z50Final)
+
+    @staticmethod
+    def _combine(n_a, mean_a, m2_a, n_b, mean_b, m2_b):
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        return mean_a + delta * n_b / n, m2_a + m2_b + delta**2 * n_a * n_b / n
+
+    def update(self, z):
+        """
+        Adds a chunk of z50Final samples (m).
+        """
+        z = np.asarray(z, dtype=float).ravel()
+        if z.size == 0:
+            return self
+        logz = np.log(z)
+        self.mean, self.m2 = self._combine(self.n, self.mean, self.m2, z.size,
+                                           z.mean(), ((z - z.mean())**2).sum())
+        self.log_mean, self.log_m2 = self._combine(self.n, self.log_mean, self.log_m2, z.size,
+                                                   logz.mean(), ((logz - logz.mean())**2).sum())
+        self.n += z.size
+        k = np.ceil(logz / self.log_gamma).astype(np.int64) - self.k_min
+        self.counts += np.bincount(np.clip(k, 0, self.counts.size - 1),
+                                   minlength=self.counts.size)
+        return self
+
+    def merge(self, other):
+        """
+        Folds in the summary of another, disjoint sample set (same sketch settings).
+        """
+        if (other.rel_acc, other.z_min, other.z_max) != (self.rel_acc, self.z_min, self.z_max):
+            raise ValueError("Cannot merge summaries with different sketch settings")
+        if other.n == 0:
+            return self
+        self.mean, self.m2 = self._combine(self.n, self.mean, self.m2,
+                                           other.n, other.mean, other.m2)
+        self.log_mean, self.log_m2 = self._combine(self.n, self.log_mean, self.log_m2,
+                                                   other.n, other.log_mean, other.log_m2)
+        self.n += other.n
+        self.counts += other.counts
+        return self
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2 / self.n)
+
+    @property
+    def log_std(self):
+        return np.sqrt(self.log_m2 / self.n)
+
+    def bucket_values(self):
+        """
+        Representative depth of every bucket (m): the point within rel_acc of
+        both bucket edges.
+        """
+        k = np.arange(self.counts.size) + self.k_min
+        return 2 * np.exp(k * self.log_gamma) / (1 + np.exp(self.log_gamma))
+
+    def quantile(self, p):
+        """
+        Depth(s) of non-exceedance probability p from the sketch (m).
+        """
+        rank = np.asarray(p, dtype=float) * (self.n - 1)
+        k = np.searchsorted(np.cumsum(self.counts), rank, side='right')
+        return self.bucket_values()[np.minimum(k, self.counts.size - 1)]
+
+    def exceedance(self, z):
+        """
+        Empirical probability that z50Final exceeds z (m), to the resolution of the sketch.
+        """
+        k = np.ceil(np.log(np.asarray(z, dtype=float)) / self.log_gamma).astype(np.int64) - self.k_min
+        cum = np.concatenate(([0], np.cumsum(self.counts)))
+        return 1 - cum[np.clip(k, -1, self.counts.size - 1) + 1] / self.n
+
+    def results(self):
+        """
+        The statistics keys of LHS_scour_hazard, and the hazard curve on the
+        occupied buckets: z50Final_sort (bucket depths), zP (lognormal CDF there)
+        and zP_empirical (fraction of samples up to and including the bucket).
+        """
+        occupied = self.counts > 0
+        z_sort = self.bucket_values()[occupied]
+        return {
+            'n': self.n,
+            'z50Final_sort': z_sort,
+            'zP': ndtr((np.log(z_sort) - self.log_mean) / self.log_std),
+            'zP_empirical': np.cumsum(self.counts[occupied]) / self.n,
+            'z50Mean': self.mean,
+            'z50std': self.std,
+            'z50LogMean': self.log_mean,
+            'z50LogStd': self.log_std,
+        }
+
+
+def LHS_scour_hazard_stream(lhsN, chunk_size=10**6, vel=10, dPier=2, gama=1e-6, zDot=8,
+                            Rey=None, seed=None, chunks=None):
+    """
+    Generator version of LHS_scour_hazard for sample counts that do not fit in
+    memory: yields z50Final (m) in chunks of at most chunk_size samples.
+
+    The lhsN strata of the unit interval are dealt out round-robin: chunk k gets
+    strata k, k + nChunks, k + 2 nChunks, ... (nChunks = ceil(lhsN / chunk_size)).
+    All chunks together are one Latin Hypercube sample of size lhsN, and every
+    chunk, or any run of leading chunks, is itself stratified over the whole
+    distribution. Memory stays at O(chunk_size).
+
+    Chunk k draws from its own stream, child k of SeedSequence(seed) (see
+    chunk_seed), so a chunk is the same whichever process draws it: workers can
+    split the chunks (chunks=range(w, nChunks, nWorkers)) and merge their
+    ScourHazardSummary objects, and the samples are bit for bit those of a
+    single process run with the same seed.
+
+    Parameters:
+        lhsN (int): Total number of Latin Hypercube Samples.
+        chunk_size (int): Largest number of samples per yielded chunk.
+        vel, dPier, gama, zDot, Rey: As in LHS_scour_hazard.
+        seed (int, SeedSequence or None): Root seed of the chunk streams; None
+                                          draws one from the global np.random state.
+        chunks (iterable or None): Indices of the chunks to draw (default all).
+
+    Yields:
+        np.ndarray: z50Final of the chunk, in random order.
+    """
+    z50 = scour_depth_z50(vel, dPier, gama, zDot, Rey)
+    seed_seq = hazard_seed_sequence(seed)
+    nChunks = -(-lhsN // chunk_size)
+    for k in (range(nChunks) if chunks is None else chunks):
+        rng = np.random.default_rng(chunk_seed(seed_seq, k))
+        strata = np.arange(k, lhsN, nChunks)
+        randp = (strata + rng.random(strata.size)) / lhsN
+        lhs_err = rng.permutation(ndtri(randp))
+        yield z50_final(z50, lhs_err)
+
+
+def stream_scour_hazard(lhsN, chunk_size=10**6, vel=10, dPier=2, gama=1e-6, zDot=8, Rey=None,
+                        seed=None, chunks=None, summary=None):
+    """
+    Draws lhsN samples with LHS_scour_hazard_stream and folds them into a
+    ScourHazardSummary (a new one if summary is None), which is returned.
+    """
+    summary = ScourHazardSummary() if summary is None else summary
+    for chunk in LHS_scour_hazard_stream(lhsN, chunk_size, vel, dPier, gama, zDot, Rey,
+                                         seed, chunks):
+        summary.update(chunk)
+    return summary
+
+
+def LHS_design(n, d, rng=None, criterion=None, iterations=10):
+    """
+    n-point Latin Hypercube design in d dimensions on the unit cube: every column
+    has exactly one point in each of the n strata, and the columns are permuted
+    independently.
+
+    Parameters:
+        n (int): Number of points.
+        d (int): Number of dimensions.
+        rng (Generator, int, SeedSequence or None): Random stream (see hazard_rng).
+        criterion (str or None): Optimisation of the column pairing:
+            - 'maximin': the best of `iterations` random designs by the smallest
+              nearest-neighbour distance (k-d tree, O(n log n) per design);
+            - 'correlation': Iman-Conover reordering of the columns, which
+              removes the spurious rank correlation between them.
+        iterations (int): Candidate designs of 'maximin'.
+
+    Returns:
+        np.ndarray: (n, d) design in [0, 1).
+    """
+    rng = hazard_rng(rng)
+
+    def draw():
+        return rng.permuted((np.arange(n)[:, None] + rng.random((n, d))) / n, axis=0)
+
+    if criterion is None or d == 1:
+        return draw()  # a single column has no pairing to optimise
+    if criterion == 'maximin':
+        best, best_dist = None, -1.0
+        for _ in range(iterations):
+            u = draw()
+            dist = cKDTree(u).query(u, k=2)[0][:, 1].min()
+            if dist > best_dist:
+                best, best_dist = u, dist
+        return best
+    if criterion == 'correlation':
+        # Iman-Conover: map the ranks to normal scores, whiten their sample
+        # correlation, and reorder each column to the ranks of the whitened scores
+        u = draw()
+        scores = ndtri((u.argsort(axis=0).argsort(axis=0) + 1) / (n + 1))
+        whitened = scores @ np.linalg.inv(np.linalg.cholesky(np.corrcoef(scores, rowvar=False))).T
+        return np.take_along_axis(np.sort(u, axis=0), whitened.argsort(axis=0).argsort(axis=0), axis=0)
+    raise ValueError(f"Unknown criterion {criterion!r}; use None, 'maximin' or 'correlation'")
+
+
+def QMC_design(n, d, method='sobol', rng=None, start=0):
+    """
+    Points start, ..., start + n - 1 of a scrambled Sobol' or Halton sequence in d
+    dimensions on the unit cube.
+
+    Unlike a Latin Hypercube, the sequence can be extended: the next n points of
+    a set come from the same call with start=n. The scrambling is drawn from
+    rng, so the points only continue the earlier set when rng seeds it the same
+    way (the same int seed or SeedSequence, not an already used Generator).
+    Sobol' points keep their balance properties when start and n are powers of 2.
+
+    Parameters:
+        n (int): Number of points.
+        d (int): Number of dimensions.
+        method (str): 'sobol' or 'halton'.
+        rng (Generator, int, SeedSequence or None): Scrambling (see hazard_rng).
+        start (int): Index of the first point in the sequence.
+
+    Returns:
+        np.ndarray: (n, d) points in (0, 1).
+    """
+    engines = {'sobol': qmc.Sobol, 'halton': qmc.Halton}
+    if method not in engines:
+        raise ValueError(f"Unknown QMC method {method!r}; use 'sobol' or 'halton'")
+    # seed= takes a Generator on every SciPy with qmc (rng= only from SciPy 1.15)
+    engine = engines[method](d, scramble=True, seed=hazard_rng(rng))
+    if start:
+        engine.fast_forward(start)
+    # ndtri(0) is -inf; a scrambled point lands on 0 only by accident
+    return np.maximum(engine.random(n), np.finfo(float).tiny)
+
+
+def sample_design(n, d, sampling='lhs', rng=None, criterion=None, iterations=10, start=0):
+    """
+    (n, d) unit-cube design of LHS_design (sampling='lhs') or QMC_design
+    ('sobol' / 'halton'); only the QMC designs can be extended with start > 0.
+    """
+    if sampling == 'lhs':
+        if start:
+            raise ValueError("A Latin Hypercube design cannot be extended; use 'sobol' or 'halton'")
+        return LHS_design(n, d, rng, criterion, iterations)
+    return QMC_design(n, d, sampling, rng, start)
+
+
+def scour_material_design(n, vel=10, dPier=2, gama=1e-6, zDot=8, Rey=None,
+                          fc=(fc_mean, fc_std), fy=(fy_mean, fy_std), rng=None,
+                          criterion=None, iterations=10, sampling='lhs', start=0):
+    """
+    Joint Latin Hypercube design of scour depth, fc and fy for the pushover
+    campaign: the three columns of one LHS_design are mapped to the scour depth
+    of the LHS_scour_hazard model and to normal fc and fy (mean, std of
+    parameters.py).
+
+    Parameters:
+        n (int): Number of samples.
+        vel, dPier, gama, zDot, Rey: Scour scenario, as in LHS_scour_hazard.
+        fc, fy (tuple): (mean, std) of the concrete and steel strengths (MPa).
+        rng, criterion, iterations: As in LHS_design.
+        sampling (str): 'lhs', or 'sobol' / 'halton' for a QMC design (QMC_design).
+        start (int): First point of a QMC design, to extend an earlier one.
+
+    Returns:
+        pd.DataFrame: Columns "Scour_Depth_mm", "fc'_MPa" and "fy_MPa", the layout
+                      of the Scour_Materials_*.xlsx sheets read by the campaign,
+                      indexed by sample ID (start, start + 1, ...).
+    """
+    u = sample_design(n, 3, sampling, rng, criterion, iterations, start)
+    z50 = scour_depth_z50(vel, dPier, gama, zDot, Rey)
+    return pd.DataFrame({
+        'Scour_Depth_mm': 1000 * z50_final(z50, ndtri(u[:, 0])),
+        "fc'_MPa": fc[0] + fc[1] * ndtri(u[:, 1]),
+        'fy_MPa': fy[0] + fy[1] * ndtri(u[:, 2]),
+    }, index=start + np.arange(n))
+
+
+def write_scour_material_designs(store_path, scenarios, n, seed=None, criterion=None,
+                                 iterations=10, sampling='lhs', start=0):
+    """
+    Generates a scour_material_design per scenario, each from its own stream of
+    spawn_rngs(seed), and writes them to the /{scenario}/design tables of a
+    campaign store (BridgeModeling/campaign_store.py), from where
+    campaign.read_store_design() feeds them to run_campaign.
+
+    Parameters:
+        store_path (str): Path of the HDF5 campaign store.
+        scenarios (dict): Mapping of scenario label -> dict of scour parameters
+                          (vel, dPier, gama, zDot, ...), e.g.
+                          {'Extreme': {'vel': 10.0, 'dPier': 1, 'zDot': 1000}}.
+        n (int): Samples per scenario.
+        seed, criterion, iterations: See spawn_rngs and LHS_design.
+        sampling, start: See scour_material_design. With a QMC sampling and the
+            same int seed, start=n_previous appends the next points of every
+            scenario to the designs already in the store.
+
+    Returns:
+        dict: Mapping of scenario label -> design DataFrame.
+    """
+    from BridgeModeling import CampaignStore
+
+    designs = {label: scour_material_design(n, **params, rng=rng, criterion=criterion,
+                                            iterations=iterations, sampling=sampling, start=start)
+               for (label, params), rng in zip(scenarios.items(), spawn_rngs(seed, len(scenarios)))}
+    with CampaignStore(store_path) as store:
+        for label, design in designs.items():
+            store.write_design(label, design, start)
+    return designs
+
+
+def combine_simulated_samples(simulation_results, samples=True):
     """
     Combines multiple simulation results from LHS_scour_hazard and calculates overall statistics.
 
+    The statistics come from merging the per-result summaries (ScourHazardSummary),
+    so they cost O(number of results) rather than O(total samples); a result dict
+    without a 'summary' is summarised from its z50Final. The default samples=True
+    still concatenates and sorts every raw z50Final for the exact hazard curve,
+    an O(total samples) step; only samples=False stays O(number of results), and
+    it is the path for the summaries of stream_scour_hazard, which keep no samples.
+
     Parameters:
-        simulation_results (list): A list of dictionaries, each returned by LHS_scour_hazard.
+        simulation_results (list): Dictionaries returned by LHS_scour_hazard (or
+                                   any dict with a 'summary' or a 'z50Final'), or
+                                   ScourHazardSummary objects, e.g. from
+                                   stream_scour_hazard. A ScourHazardSummary.results()
+                                   dict holds neither and cannot be combined.
+        samples (bool): Concatenate and sort the raw z50Final arrays for the exact
+                        hazard curve (the default; every result needs its z50Final).
+                        With samples=False no raw array is touched: z50Final is
+                        not returned, and z50Final_sort / zP are approximate,
+                        taken at the occupied sketch buckets (within the
+                        summary's rel_acc, 0.5% by default, of the sample depths;
+                        see ScourHazardSummary.results), with zP_empirical added.
 
     Returns:
         results (dict): A dictionary containing the combined simulation results with the structure:
-            - z50Final: Combined array of final scour depths (in m)
+            - z50Final: Combined array of final scour depths (in m), only with samples=True
             - z50Final_sort: Sorted combined array of final scour depths (in m)
             - zP: Lognormal CDF values evaluated at the sorted combined scour depths
             - z50Mean: Mean of the combined z50Final
             - z50std: Standard deviation of the combined z50Final
             - z50LogMean: Mean of the logarithm of the combined z50Final
             - z50LogStd: Standard deviation of the logarithm of the combined z50Final
+            - summary: The merged ScourHazardSummary
     """
-    # Concatenate all z50Final arrays from each simulation
-    combined_z50 = np.concatenate([sim['z50Final'] for sim in simulation_results])
-    # Sort the combined data
-    combined_z50_sort = np.sort(combined_z50)
-    # Calculate overall statistical parameters
-    z50Mean = np.mean(combined_z50)
-    z50std = np.std(combined_z50)
-    z50LogMean = np.mean(np.log(combined_z50))
-    z50LogStd = np.std(np.log(combined_z50))
-    # Compute the lognormal CDF for the sorted combined data
-    zP = lognorm.cdf(combined_z50_sort, s=z50LogStd, scale=np.exp(z50LogMean))
-    
-    results = {
-        'z50Final': combined_z50,
-        'z50Final_sort': combined_z50_sort,
-        'zP': zP,
-        'z50Mean': z50Mean,
-        'z50std': z50std,
-        'z50LogMean': z50LogMean,
-        'z50LogStd': z50LogStd
-    }
-    
+    def result_summary(i, sim):
+        if isinstance(sim, ScourHazardSummary):
+            return sim
+        if 'summary' in sim:
+            return sim['summary']
+        if 'z50Final' in sim:
+            return ScourHazardSummary().update(sim['z50Final'])
+        raise ValueError(f"Simulation result {i} has neither a 'summary' nor 'z50Final' "
+                         "(a ScourHazardSummary.results() dict cannot be merged; "
+                         "pass the ScourHazardSummary itself)")
+
+    if samples:
+        missing = [i for i, sim in enumerate(simulation_results)
+                   if isinstance(sim, ScourHazardSummary) or 'z50Final' not in sim]
+        if missing:
+            raise ValueError(f"samples=True needs the z50Final of every result; results "
+                             f"{missing} have none (use samples=False to merge their summaries)")
+
+    # Merge the per-result summaries
+    summary = ScourHazardSummary()
+    for i, sim in enumerate(simulation_results):
+        summary.merge(result_summary(i, sim))
+    results = summary.results()
+    results['summary'] = summary
+
+    if samples:
+        # Concatenate all z50Final arrays from each simulation
+        combined_z50 = np.concatenate([sim['z50Final'] for sim in simulation_results])
+        # Sort the combined data
+        combined_z50_sort = np.sort(combined_z50)
+        # Compute the lognormal CDF for the sorted combined data
+        zP = ndtr((np.log(combined_z50_sort) - summary.log_mean) / summary.log_std)
+        results.update({
+            'z50Final': combined_z50,
+            'z50Final_sort': combined_z50_sort,
+            'zP': zP,
+        })
+        del results['zP_empirical']
+
     return results
 
 
@@ -0,0 +1,6 @@
+# The modules under test live at the repository root and in BridgeModeling/,
+# which are not installed packages; put the root on the import path.
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,118 @@
+# Regression tests of the prefix-sum bilinear fits against the grid loop of
+# profile_fit on random, tied-d and short-tail curves, and of the batched fit
+# against the single-curve one.
+import numpy as np
+import pytest
+
+from fit_bilinear_profile import (TAIL_RTOL, fit_bilinear_profile, fit_bilinear_profile_batch,
+                                  fit_bilinear_profile_fast, profile_fit)
+
+SEEDS = range(4)
+
+
+def admissible_grid(d, dy_grid):
+    # the dy of dy_grid that split_objective scores: a tail of at least two distinct
+    # d with Σ(d - dy)² above rounding noise
+    keep = []
+    for dy in dy_grid:
+        t = d[d >= dy]
+        if len(t) >= 2 and np.ptp(t) > 0 and ((t - dy)**2).sum() > TAIL_RTOL * (t**2).sum():
+            keep.append(dy)
+    return np.array(keep)
+
+
+def random_curves(num_curves, rng):
+    # random (d, f) clouds, curves with tied d and bilinear curves whose
+    # post-yield tail holds only a few points
+    curves = []
+    for i in range(num_curves):
+        n = int(rng.integers(3, 200))
+        if i % 3 == 0:
+            d = rng.uniform(0, rng.uniform(0.01, 20), n)
+            f = rng.normal(size=n) * rng.uniform(0.1, 100)
+        elif i % 3 == 1:
+            d = np.round(rng.uniform(0, 5, n), 1)
+            f = rng.normal(size=n)
+        else:
+            d = np.sort(rng.uniform(0, 0.05, n))
+            dy = d[-int(rng.integers(2, min(n, 6) + 1))]
+            f = np.where(d < dy, 3e4 * d, 3e4 * dy + 500 * (d - dy)) + rng.normal(size=n) * 5
+        curves.append((d, f))
+    return curves
+
+
+def objective(d, f, k1, k2, dy):
+    fhat = np.where(d < dy, k1 * d, k2 * d + (k1 - k2) * dy)
+    return ((f - fhat)**2).sum()
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_fast_fit_matches_profile_fit(seed, num_curves=300, num_grid=200):
+    # same answer as profile_fit over the admissible dy grid, and refining never scores worse
+    for d, f in random_curves(num_curves, np.random.default_rng(seed)):
+        dy_grid = np.linspace(d.min() + 1e-6, d.max() - 1e-6, num_grid)
+        with np.errstate(invalid="ignore"):
+            ref = profile_fit(d, f, admissible_grid(d, dy_grid))
+        if ref[0] is None:
+            with pytest.raises(ValueError):
+                fit_bilinear_profile_fast(d, f, num_grid)
+            continue
+        grid = fit_bilinear_profile_fast(d, f, num_grid, refine=False)[:3]
+        np.testing.assert_allclose(grid, ref, rtol=1e-6, atol=1e-12)
+        fine = fit_bilinear_profile_fast(d, f, num_grid)[:3]
+        assert objective(d, f, *fine) <= objective(d, f, *ref) * (1 + 1e-9) + 1e-12
+
+
+@pytest.mark.parametrize("seed", [17, 24, 25])
+def test_fast_fit_short_tail(seed):
+    # the last grid point leaves a one-point tail whose Σ(d - dy)² (~1e-12) used to
+    # cancel to rounding noise and win the search with |k2| ~ 1e6 on these curves
+    rng = np.random.default_rng(seed)
+    d = rng.uniform(0, 12.49, 138)
+    f = rng.normal(size=138)
+    with np.errstate(invalid="ignore"):
+        ref = fit_bilinear_profile(d, f)
+    np.testing.assert_allclose(fit_bilinear_profile_fast(d, f, refine=False), ref, rtol=1e-9)
+
+
+# curves fit_bilinear_profile_fast rejects with ValueError: too short, an all-tied
+# tail, and NaN in d or f
+UNFIT_CURVES = [
+    (np.array([]), np.array([])),
+    (np.array([0.01]), np.array([1.0])),
+    (np.array([0.0, 0.01]), np.array([0.0, 1.0])),
+    (np.array([0.0, 0.01, 0.01]), np.array([0.0, 1.0, 1.5])),
+    (np.array([0.0, 0.01, np.nan, 0.03, 0.04]), np.array([0.0, 1.0, 1.5, 1.6, 1.7])),
+    (np.array([0.0, 0.01, 0.02, 0.03, 0.04]), np.array([0.0, 1.0, np.nan, 1.6, 1.7])),
+]
+
+
+@pytest.mark.parametrize("refine", [False, True])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_batch_fit_matches_fast_fit(seed, refine, num_curves=300, num_grid=200):
+    # ragged curves, padded per chunk and split over several chunks by chunk_size
+    curves = random_curves(num_curves, np.random.default_rng(seed))
+    batch = np.stack(fit_bilinear_profile_batch(curves, num_grid, refine, chunk_size=64))
+    for i, (d, f) in enumerate(curves):
+        try:
+            fast = fit_bilinear_profile_fast(d, f, num_grid, refine)
+        except ValueError:
+            assert np.isnan(batch[:, i]).all()
+            continue
+        np.testing.assert_allclose(batch[:, i], fast, rtol=1e-8, atol=1e-12)
+
+
+@pytest.mark.parametrize("index", range(len(UNFIT_CURVES)))
+def test_batch_fit_unfit_curves(index):
+    # the batch returns an all-NaN row where the single-curve fit raises, and the
+    # other curves of the batch are unaffected
+    d, f = UNFIT_CURVES[index]
+    with pytest.raises(ValueError):
+        fit_bilinear_profile_fast(d, f)
+    good_d = np.linspace(0, 0.05, 100)
+    good_f = np.minimum(3e4 * good_d, 600 + 500 * good_d)
+    k1, k2, dy, Vy = fit_bilinear_profile_batch([(good_d, good_f), (d, f), (good_d, good_f)])
+    assert np.isnan([k1[1], k2[1], dy[1], Vy[1]]).all()
+    good = fit_bilinear_profile_fast(good_d, good_f)
+    for i in (0, 2):
+        np.testing.assert_allclose([k1[i], k2[i], dy[i], Vy[i]], good, rtol=1e-12)